@@ -0,0 +1,87 @@
+"""
+Compares the JSON and MessagePack wire encodings of obs-websocket messages for the
+requests and responses behind the existing controller methods.
+
+Run with: python benchmarks/wire_encoding.py
+Requires msgpack to be installed.
+"""
+import base64
+import json
+import os
+import time
+
+import msgpack
+
+
+def request(request_type, request_data=None):
+    message = {"op": 6, "d": {"requestType": request_type, "requestId": "1"}}
+    if request_data:
+        message["d"]["requestData"] = request_data
+    return message
+
+
+def response(request_type, response_data):
+    return {"op": 7, "d": {"requestType": request_type, "requestId": "1",
+                           "requestStatus": {"result": True, "code": 100}, "responseData": response_data}}
+
+
+def event(event_type, event_data):
+    return {"op": 5, "d": {"eventType": event_type, "eventIntent": 1 << 7, "eventData": event_data}}
+
+
+def transform(index):
+    return {"alignment": 5, "boundsAlignment": 0, "boundsHeight": 0.0, "boundsType": "OBS_BOUNDS_NONE",
+            "boundsWidth": 0.0, "cropBottom": 0, "cropLeft": 0, "cropRight": 0, "cropTop": 0,
+            "height": 1080.0, "positionX": 12.5 * index, "positionY": 7.25 * index, "rotation": 0.0,
+            "scaleX": 1.0, "scaleY": 1.0, "sourceHeight": 1080.0, "sourceWidth": 1920.0, "width": 1920.0}
+
+
+def scene_items(count):
+    return [{"inputKind": "browser_source", "isGroup": None, "sceneItemBlendMode": "OBS_BLEND_NORMAL",
+             "sceneItemEnabled": True, "sceneItemId": index, "sceneItemIndex": index, "sceneItemLocked": False,
+             "sceneItemTransform": transform(index), "sourceName": f"Source {index}",
+             "sourceType": "OBS_SOURCE_TYPE_INPUT", "sourceUuid": f"{index:08x}-0000-0000-0000-000000000000"}
+            for index in range(count)]
+
+
+def inputs(count):
+    return [{"inputKind": "browser_source", "inputName": f"Input {index}",
+             "inputUuid": f"{index:08x}-0000-0000-0000-000000000000", "unversionedInputKind": "browser_source"}
+            for index in range(count)]
+
+
+MESSAGES = {
+    "scenes.set_current (request)": request("SetCurrentProgramScene", {"sceneName": "Main"}),
+    "source.set_enabled (request)": request("SetSceneItemEnabled", {"sceneName": "Main", "sceneItemId": 12, "sceneItemEnabled": True}),
+    "inputs.set_settings (request)": request("SetInputSettings", {"inputName": "Ticker", "inputSettings": {"text": "x" * 400, "font": {"face": "Arial", "size": 48}}, "overlay": True}),
+    "scenes.get_items, 500 items": response("GetSceneItemList", {"sceneItems": scene_items(500)}),
+    "inputs.get_list, 2000 inputs": response("GetInputList", {"inputs": inputs(2000)}),
+    "source.get_screenshot, 1 MB": response("GetSourceScreenshot", {"imageData": "data:image/png;base64," + base64.b64encode(os.urandom(1 << 20)).decode()}),
+    "SceneItemTransformChanged event": event("SceneItemTransformChanged", {"sceneName": "Main", "sceneItemId": 3, "sceneItemTransform": transform(3)}),
+    "InputVolumeMeters event": event("InputVolumeMeters", {"inputs": [{"inputName": f"Input {index}", "inputLevelsMul": [[0.1, 0.2, 0.3]] * 2} for index in range(16)]}),
+}
+
+
+def measure(function, argument, minimum_time=0.2):
+    runs = 0
+    started = time.perf_counter()
+    while True:
+        function(argument)
+        runs += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= minimum_time:
+            return elapsed / runs
+
+
+def main():
+    print(f"{'message':<34} {'json B':>10} {'msgpack B':>10} {'json enc':>10} {'mp enc':>10} {'json dec':>10} {'mp dec':>10}")
+    for name, message in MESSAGES.items():
+        encoded_json = json.dumps(message)
+        encoded_msgpack = msgpack.packb(message)
+        print(f"{name:<34} {len(encoded_json.encode()):>10} {len(encoded_msgpack):>10}"
+              f" {measure(json.dumps, message) * 1e6:>8.1f}us {measure(msgpack.packb, message) * 1e6:>8.1f}us"
+              f" {measure(json.loads, encoded_json) * 1e6:>8.1f}us {measure(msgpack.unpackb, encoded_msgpack) * 1e6:>8.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Runs a stream of controller method calls against OBS over one connection.
+
+Every line is either a JSON object such as
+    {"method": "inputs.set_muted", "args": ["Mic", true]}
+or a command in the shell-like DSL
+    inputs.set_muted Mic true
+    source.set_enabled "Scene 1" Camera false
+    scenes.set_current "Scene 1"
+where every argument is parsed as JSON if possible and used as a string otherwise, and
+name=value arguments are passed as keyword arguments. Empty lines and lines starting
+with # are ignored.
+
+Consecutive commands that do not depend on each other are sent concurrently over the
+pipelined connection. Commands depend on each other when they share a string argument
+(e.g. the same input or scene name) or change global state such as the current scene.
+Commands without string arguments, such as scenes.get or inputs.get_list, may read or
+change anything, so they run alone after every command before them has finished.
+
+Usage: python -m py_obs_controller [--host HOST] [--port PORT] [--password PASSWORD] [FILE]
+"""
+import argparse
+import json
+import os
+import shlex
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from .obs_controller import ObsController, CONTROLLERS
+
+GLOBAL_CONTROLLERS = ["record", "stream", "virtual_camera", "general", "timeline"]
+
+
+def parse_command(line: str) -> tuple:
+    """
+    Parses a command line.
+
+    :param line: A JSON object or a DSL command.
+    :return: A tuple with the method, e.g. 'inputs.set_muted', the positional arguments and the keyword arguments.
+    """
+    if line.startswith("{"):
+        command = json.loads(line)
+        return command["method"], list(command.get("args", [])), dict(command.get("kwargs", {}))
+    tokens = shlex.split(line)
+    args, kwargs = [], {}
+    for token in tokens[1:]:
+        name, separator, value = token.partition("=")
+        if separator and name.isidentifier():
+            kwargs[name] = parse_value(value)
+        else:
+            args.append(parse_value(token))
+    return tokens[0], args, kwargs
+
+
+def parse_value(token: str):
+    """
+    Returns a DSL argument as the JSON value it is, or as a string if it is not valid JSON.
+    """
+    try:
+        return json.loads(token)
+    except ValueError:
+        return token
+
+
+def command_keys(method: str, args: list, kwargs: dict) -> set:
+    """
+    Returns the keys of the state a command reads or changes. Commands that share a key depend on each other,
+    and a command without keys depends on every other command.
+    """
+    keys = {value for value in list(args) + list(kwargs.values()) if isinstance(value, str)}
+    controller = method.split(".", 1)[0]
+    if controller in GLOBAL_CONTROLLERS or "current" in method:
+        keys.add(f".{controller}")
+    return keys
+
+
+def resolve(obs_controller: ObsController, method: str):
+    """
+    Returns the bound controller method for a method name like 'inputs.set_muted'.
+    """
+    controller, _, name = method.partition(".")
+    if controller not in CONTROLLERS or not name or name.startswith("_"):
+        raise ValueError(f"Unknown method: {method}")
+    function = getattr(getattr(obs_controller, controller), name, None)
+    if not callable(function):
+        raise ValueError(f"Unknown method: {method}")
+    return function
+
+
+def run(obs_controller: ObsController, lines, workers: int = 16, max_wave: int = 256):
+    """
+    Runs commands, sending consecutive independent commands concurrently.
+
+    :param obs_controller: The ObsController to run the commands on.
+    :param lines: An iterable of command lines.
+    :param workers: The number of commands in flight at the same time.
+    :param max_wave: The maximum number of commands sent before waiting for their results.
+    :return: A generator of (line number, result, error) tuples in the order of the lines.
+    """
+    with ThreadPoolExecutor(workers) as executor:
+        wave, wave_keys = [], set()
+        for number, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                method, args, kwargs = parse_command(line)
+                function = resolve(obs_controller, method)
+            except (ValueError, KeyError, TypeError) as e:
+                yield from _finish(wave)
+                wave, wave_keys = [], set()
+                yield number, None, e
+                continue
+
+            keys = command_keys(method, args, kwargs)
+            if not keys or keys & wave_keys or len(wave) >= max_wave:
+                yield from _finish(wave)
+                wave, wave_keys = [], set()
+            wave.append((number, executor.submit(function, *args, **kwargs)))
+            wave_keys |= keys
+            if not keys:
+                yield from _finish(wave)
+                wave, wave_keys = [], set()
+        yield from _finish(wave)
+
+
+def _finish(wave: list):
+    for number, future in wave:
+        try:
+            yield number, future.result(), None
+        except Exception as e:
+            yield number, None, e
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m py_obs_controller", description="Runs controller method calls against OBS.")
+    parser.add_argument("file", nargs="?", default="-", help="The command file. Standard input if not specified or '-'.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4455)
+    parser.add_argument("--password", default=os.environ.get("OBS_WEBSOCKET_PASSWORD", ""),
+                        help="Defaults to the OBS_WEBSOCKET_PASSWORD environment variable.")
+    parser.add_argument("--encoding", choices=["json", "msgpack"], default="json")
+    parser.add_argument("--workers", type=int, default=16, help="The number of commands in flight at the same time.")
+    parser.add_argument("--stop-on-error", action="store_true", help="Stop at the first failed command.")
+    options = parser.parse_args(argv)
+
+    source = sys.stdin if options.file == "-" else open(options.file, encoding="utf-8")
+    obs_controller = ObsController(options.host, options.port, options.password, encoding=options.encoding)
+    errors = 0
+    try:
+        max_wave = 1 if source.isatty() else options.workers * 16
+        for number, result, error in run(obs_controller, source, options.workers, max_wave):
+            if error is not None:
+                errors += 1
+                print(f"line {number}: {type(error).__name__}: {error}", file=sys.stderr)
+                if options.stop_on_error:
+                    break
+            elif result is not None:
+                print(json.dumps({"line": number, "result": result}, default=str), flush=True)
+    finally:
+        obs_controller.client.disconnect()
+        if source is not sys.stdin:
+            source.close()
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,127 @@
+import binascii
+import json
+import math
+from itertools import count
+
+_batch_ids = count(1)
+
 def get_attributes_as_dict(obj):
     """ Returns a dictionary of all attributes of an object."""
-    return {attr: getattr(obj, attr) for attr in dir(obj) if not callable(getattr(obj, attr)) and not attr.startswith("__")}
\ No newline at end of file
+    return {attr: getattr(obj, attr) for attr in dir(obj) if not callable(getattr(obj, attr)) and not attr.startswith("__")}
+
+def with_priority(client, priority: str):
+    """
+    Returns a client that sends its requests with the given priority class.
+
+    :param client: An instance of the OBS WebSocket client.
+    :param priority: The priority class, or None to use the client as it is.
+    :return: The client to use for the requests.
+    """
+    if priority is None:
+        return client
+    if not hasattr(client, "with_priority"):
+        raise ValueError("A priority can only be used with a client created by a RequestScheduler")
+    return client.with_priority(priority)
+
+def send_request_batch(client, requests: list, halt_on_failure: bool = False, execution_type: int = 0) -> list:
+    """
+    Sends several requests to OBS as a single RequestBatch message.
+
+    :param client: An instance of the OBS WebSocket client.
+    :param requests: A list of (request_type, request_data) tuples. request_data may be None.
+    :param halt_on_failure: Whether OBS should stop processing the batch after the first failed request.
+    :param execution_type: 0 for serial realtime, 1 for serial frame, 2 for parallel.
+    :return: A list with the raw result of every executed request, in order.
+    """
+    if hasattr(client, "send_batch"):
+        return client.send_batch(requests, halt_on_failure, execution_type)
+    batch = []
+    for request_type, request_data in requests:
+        request = {"requestType": request_type}
+        if request_data:
+            request["requestData"] = request_data
+        batch.append(request)
+    payload = {
+        "op": 8,
+        "d": {
+            "requestId": f"batch-{next(_batch_ids)}",
+            "haltOnFailure": halt_on_failure,
+            "executionType": execution_type,
+            "requests": batch,
+        },
+    }
+    ws = client.base_client.ws
+    ws.send(json.dumps(payload))
+    return json.loads(ws.recv())["d"]["results"]
+
+def latency_summary(latencies: list) -> dict:
+    """
+    Returns the distribution of a list of latencies.
+
+    :param latencies: The latencies in seconds.
+    :return: A dictionary with the count and the mean, p50, p95, p99 and max latency, or only the count if there are none.
+    """
+    if not latencies:
+        return {"count": 0}
+    latencies = sorted(latencies)
+    return {
+        "count": len(latencies),
+        "mean": sum(latencies) / len(latencies),
+        "p50": latencies[int(len(latencies) * 0.50)],
+        "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "max": latencies[-1],
+    }
+
+def transform_matches(transform: dict, fields: dict) -> bool:
+    """
+    Returns whether a scene item transform reported by OBS has the given field values. Numbers
+    are compared with a small tolerance, since OBS stores them as 32-bit floats.
+
+    :param transform: The transform, e.g. from a SceneItemTransformChanged event.
+    :param fields: The expected transformation properties.
+    :return: True if every field matches.
+    """
+    for key, value in fields.items():
+        actual = transform.get(key)
+        if isinstance(value, (int, float)) and isinstance(actual, (int, float)):
+            if not math.isclose(actual, value, rel_tol=1e-6, abs_tol=1e-3):
+                return False
+        elif actual != value:
+            return False
+    return True
+
+def decoded_base64_size(data: str) -> int:
+    """
+    Returns the number of bytes a base64 string, optionally prefixed with a data URI header, decodes to.
+    """
+    start = data.find(",", 0, 256) + 1
+    padding = (data[-1:] == "=") + (data[-2:-1] == "=")
+    return (len(data) - start) // 4 * 3 - padding
+
+def decode_base64_into(data: str, out: bytearray = None, chunk_size: int = 65536) -> memoryview:
+    """
+    Decodes a base64 string, optionally prefixed with a data URI header, into a buffer.
+    The string is decoded in chunks of chunk_size characters, so no full size copy of the
+    encoded or decoded data is made besides the output buffer itself.
+
+    :param data: The base64 string, e.g. 'data:image/png;base64,iVBORw0...'.
+    :param out: Optional. The buffer to decode into. It must hold at least decoded_base64_size(data) bytes.
+                It is never resized, so views returned by earlier calls stay valid.
+    :param chunk_size: The number of characters decoded at a time. Must be a multiple of 4.
+    :return: A memoryview over the decoded bytes in the buffer.
+    """
+    start = data.find(",", 0, 256) + 1
+    size = decoded_base64_size(data)
+    if out is None:
+        out = bytearray(size)
+    elif len(out) < size:
+        raise ValueError(f"The output buffer holds {len(out)} bytes, but the data decodes to {size} bytes")
+
+    view = memoryview(out)
+    position = 0
+    for index in range(start, len(data), chunk_size):
+        decoded = binascii.a2b_base64(data[index:index + chunk_size])
+        view[position:position + len(decoded)] = decoded
+        position += len(decoded)
+    return view[:position]
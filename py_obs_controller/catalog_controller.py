@@ -0,0 +1,316 @@
+import obsws_python as obs
+import copy
+import threading
+from .__utils import send_request_batch, with_priority
+
+CATALOG_EVENTS = [
+    "InputCreated", "InputRemoved", "InputNameChanged",
+    "SceneCreated", "SceneRemoved", "SceneNameChanged",
+    "SceneItemCreated", "SceneItemRemoved", "SceneItemListReindexed",
+    "CurrentSceneCollectionChanged",
+]
+
+
+class CatalogController:
+    """
+    An indexed catalog of the inputs, scenes, groups and scene items in OBS. The catalog is
+    built with two request batches (one for the scene, input and group lists and one for the
+    items of every scene and group) and then kept up to date from OBS events, so lookups by
+    name, kind or UUID and "which scenes contain this input" are dictionary lookups instead
+    of list scans and per-scene requests.
+
+    Without event support on the client, the catalog is built once and refreshed with refresh().
+    """
+
+    def __init__(self, obs_controller: obs.ReqClient, priority: str = None):
+        """
+        Initializes the CatalogController with a reference to the OBS WebSocket client.
+        The catalog is built on the first lookup.
+
+        :param obs_controller: An instance of the OBS WebSocket client.
+        :param priority: Optional. The priority class of the requests when the client goes through a RequestScheduler.
+        """
+        self.client = with_priority(obs_controller, priority)
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._built = False
+        self._backlog = None
+        self._reset()
+
+        if hasattr(self.client, "add_event_listener"):
+            self.client.add_event_listener(self._on_event, CATALOG_EVENTS)
+
+    def refresh(self):
+        """
+        Rebuilds the whole catalog from OBS. Only one build runs at a time.
+        """
+        with self._build_lock:
+            self._build()
+
+    def _build(self):
+        with self._lock:
+            self._backlog = []
+
+        try:
+            scene_list, input_list, group_list = [
+                result.get("responseData", {}) for result in send_request_batch(
+                    self.client, [("GetSceneList", None), ("GetInputList", None), ("GetGroupList", None)])
+            ]
+            scenes = scene_list.get("scenes", [])
+            groups = group_list.get("groups", [])
+            requests = [("GetSceneItemList", {"sceneName": scene["sceneName"]}) for scene in scenes]
+            requests += [("GetGroupSceneItemList", {"sceneName": group}) for group in groups]
+            item_lists = send_request_batch(self.client, requests) if requests else []
+        except BaseException:
+            with self._lock:
+                self._backlog = None
+            raise
+
+        with self._lock:
+            self._reset()
+            for scene in scenes:
+                self._add_scene(dict(scene))
+            self.groups = set(groups)
+            for input_ in input_list.get("inputs", []):
+                self._add_input(dict(input_))
+            for (_, data), result in zip(requests, item_lists):
+                self.items_by_scene[data["sceneName"]] = {}
+                for item in result.get("responseData", {}).get("sceneItems", []):
+                    self._add_item(data["sceneName"], dict(item))
+
+            backlog, self._backlog = self._backlog, None
+            self._built = True
+            for event_type, event_data in backlog:
+                self._apply(event_type, event_data)
+                if not self._built:
+                    break
+
+    def get_input(self, input_name: str) -> dict:
+        """
+        Returns the input with the specified name.
+
+        :param input_name: The name of the input.
+        :return: A dictionary with the input name, kind and UUID, or None if there is no such input.
+        """
+        self._ensure()
+        with self._lock:
+            found = self.inputs_by_name.get(input_name)
+            return dict(found) if found is not None else None
+
+    def get_input_by_uuid(self, input_uuid: str) -> dict:
+        """
+        Returns the input with the specified UUID.
+
+        :param input_uuid: The UUID of the input.
+        :return: A dictionary with the input name, kind and UUID, or None if there is no such input.
+        """
+        self._ensure()
+        with self._lock:
+            found = self.inputs_by_uuid.get(input_uuid)
+            return dict(found) if found is not None else None
+
+    def get_inputs_by_kind(self, input_kind: str) -> list:
+        """
+        Returns all inputs of the specified kind, e.g. 'browser_source'. Both versioned and
+        unversioned kinds are accepted.
+
+        :param input_kind: The kind of the inputs.
+        :return: A list of input dictionaries.
+        """
+        self._ensure()
+        with self._lock:
+            return [dict(input_) for input_ in self.inputs_by_kind.get(input_kind, {}).values()]
+
+    def get_scene(self, scene_name: str) -> dict:
+        """
+        Returns the scene with the specified name.
+
+        :param scene_name: The name of the scene.
+        :return: A dictionary with the scene name, UUID and index, or None if there is no such scene.
+        """
+        self._ensure()
+        with self._lock:
+            found = self.scenes_by_name.get(scene_name)
+            return dict(found) if found is not None else None
+
+    def get_scene_by_uuid(self, scene_uuid: str) -> dict:
+        """
+        Returns the scene with the specified UUID.
+
+        :param scene_uuid: The UUID of the scene.
+        :return: A dictionary with the scene name, UUID and index, or None if there is no such scene.
+        """
+        self._ensure()
+        with self._lock:
+            found = self.scenes_by_uuid.get(scene_uuid)
+            return dict(found) if found is not None else None
+
+    def get_items(self, scene_name: str) -> list:
+        """
+        Returns all items in the specified scene or group.
+
+        :param scene_name: The name of the scene or group.
+        :return: A list of scene item dictionaries.
+        """
+        self._ensure()
+        with self._lock:
+            return copy.deepcopy(list(self.items_by_scene.get(scene_name, {}).values()))
+
+    def get_item(self, scene_name: str, source_name: str) -> dict:
+        """
+        Returns the item for a source in the specified scene or group. If the source is in the
+        scene more than once, the topmost item is returned.
+
+        :param scene_name: The name of the scene or group.
+        :param source_name: The name of the source.
+        :return: A scene item dictionary including the sceneItemId, or None if the source is not in the scene.
+        """
+        self._ensure()
+        with self._lock:
+            items = self.items_by_scene.get(scene_name, {})
+            items = [items[item_id] for item_id in self.scenes_by_source.get(source_name, {}).get(scene_name, ())]
+            return copy.deepcopy(max(items, key=lambda item: item.get("sceneItemIndex") or 0)) if items else None
+
+    def get_scenes_containing(self, source_name: str) -> list:
+        """
+        Returns the names of the scenes and groups that contain the specified input or scene.
+
+        :param source_name: The name of the input or scene.
+        :return: A list of scene and group names.
+        """
+        self._ensure()
+        with self._lock:
+            return sorted(self.scenes_by_source.get(source_name, {}))
+
+    def _ensure(self):
+        if self._built:
+            return
+        with self._build_lock:
+            while not self._built:
+                self._build()
+
+    def _reset(self):
+        self.inputs_by_name = {}
+        self.inputs_by_uuid = {}
+        self.inputs_by_kind = {}
+        self.scenes_by_name = {}
+        self.scenes_by_uuid = {}
+        self.groups = set()
+        self.items_by_scene = {}
+        self.scenes_by_source = {}
+
+    def _add_input(self, input_):
+        self.inputs_by_name[input_["inputName"]] = input_
+        if input_.get("inputUuid"):
+            self.inputs_by_uuid[input_["inputUuid"]] = input_
+        for kind in {input_.get("inputKind"), input_.get("unversionedInputKind")} - {None}:
+            self.inputs_by_kind.setdefault(kind, {})[input_["inputName"]] = input_
+
+    def _remove_input(self, input_name):
+        input_ = self.inputs_by_name.pop(input_name, None)
+        if input_ is None:
+            return
+        self.inputs_by_uuid.pop(input_.get("inputUuid"), None)
+        for kind in {input_.get("inputKind"), input_.get("unversionedInputKind")} - {None}:
+            self.inputs_by_kind.get(kind, {}).pop(input_name, None)
+
+    def _add_scene(self, scene):
+        self.scenes_by_name[scene["sceneName"]] = scene
+        if scene.get("sceneUuid"):
+            self.scenes_by_uuid[scene["sceneUuid"]] = scene
+
+    def _add_item(self, scene_name, item):
+        self.items_by_scene.setdefault(scene_name, {})[item["sceneItemId"]] = item
+        self.scenes_by_source.setdefault(item["sourceName"], {}).setdefault(scene_name, set()).add(item["sceneItemId"])
+
+    def _remove_item(self, scene_name, item_id):
+        item = self.items_by_scene.get(scene_name, {}).pop(item_id, None)
+        if item is None:
+            return
+        scenes = self.scenes_by_source.get(item["sourceName"], {})
+        scenes.get(scene_name, set()).discard(item_id)
+        if not scenes.get(scene_name):
+            scenes.pop(scene_name, None)
+        if not scenes:
+            self.scenes_by_source.pop(item["sourceName"], None)
+
+    def _rename_source(self, old_name, new_name):
+        scenes = self.scenes_by_source.pop(old_name, {})
+        for scene_name in scenes:
+            for item in self.items_by_scene.get(scene_name, {}).values():
+                if item["sourceName"] == old_name:
+                    item["sourceName"] = new_name
+        if scenes:
+            self.scenes_by_source[new_name] = scenes
+
+    def _rename_container(self, old_name, new_name):
+        items = self.items_by_scene.pop(old_name, {})
+        self.items_by_scene[new_name] = items
+        for item in items.values():
+            scenes = self.scenes_by_source.get(item["sourceName"], {})
+            if old_name in scenes:
+                scenes[new_name] = scenes.pop(old_name)
+
+    def _remove_container(self, scene_name):
+        for item_id in list(self.items_by_scene.get(scene_name, {})):
+            self._remove_item(scene_name, item_id)
+        self.items_by_scene.pop(scene_name, None)
+
+    def _on_event(self, event_type: str, event_data: dict):
+        with self._lock:
+            if self._backlog is not None:
+                self._backlog.append((event_type, event_data))
+            elif self._built:
+                self._apply(event_type, event_data)
+
+    def _apply(self, event_type: str, data: dict):
+        if event_type == "InputCreated":
+            self._add_input({key: data.get(key) for key in ("inputName", "inputUuid", "inputKind", "unversionedInputKind")})
+        elif event_type == "InputRemoved":
+            self._remove_input(data["inputName"])
+        elif event_type == "InputNameChanged":
+            input_ = self.inputs_by_name.get(data["oldInputName"])
+            if input_ is not None:
+                self._remove_input(data["oldInputName"])
+                input_["inputName"] = data["inputName"]
+                self._add_input(input_)
+            self._rename_source(data["oldInputName"], data["inputName"])
+        elif event_type == "SceneCreated":
+            if data.get("isGroup"):
+                self.groups.add(data["sceneName"])
+            else:
+                self._add_scene({"sceneName": data["sceneName"], "sceneUuid": data.get("sceneUuid")})
+            self.items_by_scene.setdefault(data["sceneName"], {})
+        elif event_type == "SceneRemoved":
+            scene = self.scenes_by_name.pop(data["sceneName"], None)
+            if scene is not None:
+                self.scenes_by_uuid.pop(scene.get("sceneUuid"), None)
+            self.groups.discard(data["sceneName"])
+            self._remove_container(data["sceneName"])
+        elif event_type == "SceneNameChanged":
+            old_name, new_name = data["oldSceneName"], data["sceneName"]
+            scene = self.scenes_by_name.pop(old_name, None)
+            if scene is not None:
+                scene["sceneName"] = new_name
+                self.scenes_by_name[new_name] = scene
+            if old_name in self.groups:
+                self.groups.discard(old_name)
+                self.groups.add(new_name)
+            self._rename_container(old_name, new_name)
+            self._rename_source(old_name, new_name)
+        elif event_type == "SceneItemCreated":
+            self._add_item(data["sceneName"], {
+                "sceneItemId": data["sceneItemId"],
+                "sceneItemIndex": data.get("sceneItemIndex"),
+                "sourceName": data["sourceName"],
+                "sourceUuid": data.get("sourceUuid"),
+            })
+        elif event_type == "SceneItemRemoved":
+            self._remove_item(data["sceneName"], data["sceneItemId"])
+        elif event_type == "SceneItemListReindexed":
+            items = self.items_by_scene.get(data["sceneName"], {})
+            for entry in data.get("sceneItems", []):
+                if entry["sceneItemId"] in items:
+                    items[entry["sceneItemId"]]["sceneItemIndex"] = entry["sceneItemIndex"]
+        elif event_type == "CurrentSceneCollectionChanged":
+            self._built = False
@@ -0,0 +1,93 @@
+import obsws_python as obs
+from concurrent.futures import Future
+from obsws_python.error import OBSSDKRequestError
+from obsws_python.util import as_dataclass
+from .connection import Connection
+
+
+class Client(obs.ReqClient):
+    """
+    An OBS WebSocket client with the same methods as obs.ReqClient that is safe to share
+    between threads. Requests from different threads are pipelined over one Connection and
+    matched to their responses by requestId.
+    """
+
+    def __init__(self, host: str, port: int, password: str, timeout: float = None, subs: int = 0, encoding: str = "json"):
+        """
+        Initializes the Client and connects to the OBS WebSocket server.
+
+        :param host: The IP address or hostname of the OBS WebSocket server.
+        :param port: The port number for the OBS WebSocket server.
+        :param password: The password for the OBS WebSocket server.
+        :param timeout: Optional. Seconds to wait for the connection and for every response.
+        :param subs: Optional. The eventSubscriptions bitmask sent in the Identify message.
+        :param encoding: Optional. 'json' or 'msgpack'. See Connection.
+        """
+        self.base_client = Connection(host, port, password, timeout, subs, encoding)
+
+    def add_event_listener(self, callback, event_types: list = None, subs: int = 0):
+        """
+        Registers a callback for OBS events. See Connection.add_event_listener.
+
+        :param callback: A callable that takes the event type and the event data.
+        :param event_types: Optional. The event types to receive. All events if not specified.
+        :param subs: Optional. Event subscription bits the callback needs.
+        """
+        self.base_client.add_event_listener(callback, event_types, subs)
+
+    def remove_event_listener(self, callback):
+        """
+        Removes a callback registered with add_event_listener.
+
+        :param callback: The callback to remove.
+        """
+        self.base_client.remove_event_listener(callback)
+
+    def disconnect(self):
+        self.base_client.close()
+
+    def send(self, param, data=None, raw=False):
+        return self._result(self.base_client.request(param, data), raw)
+
+    def send_async(self, param, data=None, raw=False) -> Future:
+        """
+        Sends a request without waiting for its response.
+
+        :param param: The obs-websocket request type, e.g. 'GetSceneList'.
+        :param data: Optional. The request data.
+        :param raw: True to resolve to the raw response data instead of a dataclass.
+        :return: A Future that resolves to the same value send() would return.
+        """
+        future = Future()
+
+        def done(response):
+            try:
+                future.set_result(self._result(response.result(), raw))
+            except BaseException as e:
+                future.set_exception(e)
+
+        self.base_client.request_async(param, data).add_done_callback(done)
+        return future
+
+    def send_batch(self, requests: list, halt_on_failure: bool = False, execution_type: int = 0) -> list:
+        """
+        Sends several requests as one RequestBatch message.
+
+        :param requests: A list of (request_type, request_data) tuples.
+        :param halt_on_failure: Whether OBS should stop processing the batch after the first failed request.
+        :param execution_type: 0 for serial realtime, 1 for serial frame, 2 for parallel.
+        :return: A list with the raw result of every executed request, in order.
+        """
+        return self.base_client.request_batch(requests, halt_on_failure, execution_type)
+
+    def _result(self, response: dict, raw: bool):
+        if not response["requestStatus"]["result"]:
+            raise OBSSDKRequestError(
+                response["requestType"],
+                response["requestStatus"]["code"],
+                response["requestStatus"].get("comment"),
+            )
+        if "responseData" in response:
+            if raw:
+                return response["responseData"]
+            return as_dataclass(response["requestType"], response["responseData"])
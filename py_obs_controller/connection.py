@@ -0,0 +1,277 @@
+import base64
+import hashlib
+import json
+import logging
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from itertools import count
+
+import websocket
+from obsws_python.error import OBSSDKError, OBSSDKTimeoutError
+
+from .event_bus import subscriptions_for
+
+logger = logging.getLogger(__name__)
+
+
+class Connection:
+    """
+    A single WebSocket connection to OBS that can be shared by many threads. Requests are
+    written under a short send lock and their responses are matched back to the caller by
+    requestId on a dedicated reader thread, so concurrent callers pipeline their requests
+    over the socket instead of waiting for each other's round trips.
+
+    Set recorder to a TrafficRecorder to record every request and response.
+    """
+
+    def __init__(self, host: str, port: int, password: str, timeout: float = None, subs: int = 0, encoding: str = "json"):
+        """
+        Opens the connection, identifies with the server and starts the reader thread.
+
+        :param host: The IP address or hostname of the OBS WebSocket server.
+        :param port: The port number for the OBS WebSocket server.
+        :param password: The password for the OBS WebSocket server.
+        :param timeout: Optional. Seconds to wait for the connection and for every response.
+        :param subs: Optional. The eventSubscriptions bitmask sent in the Identify message. The bits needed
+                     by the event listeners are added to it.
+        :param encoding: Optional. 'json', or 'msgpack' to ask the server for the obswebsocket.msgpack
+                         subprotocol. Falls back to JSON if the server does not accept it. Requires msgpack.
+        """
+        if encoding not in ("json", "msgpack"):
+            raise ValueError(f"Unknown encoding: {encoding}")
+        self.host = host
+        self.port = port
+        self.password = password
+        self.timeout = timeout
+        self.subs = subs
+        self._base_subs = subs
+
+        self._ids = count(1)
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._closed = False
+        self._listeners = []
+        self._listeners_lock = threading.Lock()
+        self.recorder = None
+
+        self.encoding = "json"
+        self.ws = websocket.WebSocket()
+        if encoding == "msgpack":
+            try:
+                import msgpack
+            except ImportError:
+                raise ImportError("The msgpack encoding requires msgpack to be installed")
+            self._msgpack = msgpack
+            try:
+                self.ws.connect(f"ws://{host}:{port}", timeout=timeout, subprotocols=["obswebsocket.msgpack", "obswebsocket.json"])
+                if self.ws.getsubprotocol() == "obswebsocket.msgpack":
+                    self.encoding = "msgpack"
+            except websocket.WebSocketBadStatusException:
+                self.ws = websocket.WebSocket()
+            except websocket.WebSocketException:
+                self.ws.close()
+                self.ws = websocket.WebSocket()
+        if not self.ws.connected:
+            self.ws.connect(f"ws://{host}:{port}", timeout=timeout)
+        self.server_hello = self._decode(self.ws.recv())
+        self.identified = self._identify()
+        self.ws.settimeout(None)
+
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    def request_async(self, request_type: str, request_data: dict = None) -> Future:
+        """
+        Sends a request without waiting for its response.
+
+        :param request_type: The obs-websocket request type, e.g. 'GetSceneList'.
+        :param request_data: Optional. The request data.
+        :return: A Future that resolves to the raw response ('d' field of the RequestResponse message).
+        """
+        request_id = str(next(self._ids))
+        payload = {"requestType": request_type, "requestId": request_id}
+        if request_data:
+            payload["requestData"] = request_data
+        return self._send(6, request_id, payload)
+
+    def request(self, request_type: str, request_data: dict = None) -> dict:
+        """
+        Sends a request and waits for its response.
+
+        :param request_type: The obs-websocket request type, e.g. 'GetSceneList'.
+        :param request_data: Optional. The request data.
+        :return: The raw response ('d' field of the RequestResponse message).
+        """
+        return self._wait(self.request_async(request_type, request_data))
+
+    def request_batch(self, requests: list, halt_on_failure: bool = False, execution_type: int = 0) -> list:
+        """
+        Sends several requests as one RequestBatch message and waits for the results.
+
+        :param requests: A list of (request_type, request_data) tuples. request_data may be None.
+        :param halt_on_failure: Whether OBS should stop processing the batch after the first failed request.
+        :param execution_type: 0 for serial realtime, 1 for serial frame, 2 for parallel.
+        :return: A list with the raw result of every executed request, in order.
+        """
+        batch = []
+        for request_type, request_data in requests:
+            request = {"requestType": request_type}
+            if request_data:
+                request["requestData"] = request_data
+            batch.append(request)
+        request_id = f"batch-{next(self._ids)}"
+        payload = {
+            "requestId": request_id,
+            "haltOnFailure": halt_on_failure,
+            "executionType": execution_type,
+            "requests": batch,
+        }
+        return self._wait(self._send(8, request_id, payload))["results"]
+
+    def add_event_listener(self, callback, event_types: list = None, subs: int = 0):
+        """
+        Registers a callback for the events received on this connection. Callbacks run on the
+        reader thread, so they must be quick and must never wait for a request. Registering a
+        callback again replaces its event types and subscription bits.
+
+        :param callback: A callable that takes the event type and the event data.
+        :param event_types: Optional. The event types to receive. All events if not specified.
+        :param subs: Optional. Event subscription bits the callback needs in addition to the bits of its
+                     event types. The connection re-identifies with the server when the bits needed change.
+        """
+        subs = int(subs) | (subscriptions_for(event_types) if event_types is not None else 0)
+        event_types = set(event_types) if event_types is not None else None
+        with self._listeners_lock:
+            listeners = [listener for listener in self._listeners if listener[0] != callback]
+            self._listeners = listeners + [(callback, event_types, subs)]
+            self._update_subscriptions()
+
+    def set_subscriptions(self, subs: int):
+        """
+        Changes the events the server sends on this connection with a Reidentify message.
+
+        :param subs: The new eventSubscriptions bitmask.
+        """
+        self.subs = subs
+        with self._send_lock:
+            self._write(self._encode({"op": 3, "d": {"eventSubscriptions": int(subs)}}))
+
+    def remove_event_listener(self, callback):
+        """
+        Removes a callback registered with add_event_listener. The connection re-identifies with
+        the server when its subscription bits are no longer needed.
+
+        :param callback: The callback to remove.
+        """
+        with self._listeners_lock:
+            self._listeners = [listener for listener in self._listeners if listener[0] != callback]
+            self._update_subscriptions()
+
+    def close(self):
+        """
+        Closes the connection. Requests still waiting for a response fail with an OBSSDKError.
+        """
+        self._closed = True
+        self.ws.close()
+        self._reader.join(timeout=1)
+        self._fail_pending(OBSSDKError("The connection to OBS was closed"))
+
+    def _send(self, op: int, request_id: str, data: dict) -> Future:
+        future = Future()
+        future.request_id = request_id
+        message = self._encode({"op": op, "d": data})
+        with self._pending_lock:
+            if self._closed:
+                raise OBSSDKError("The connection to OBS is closed")
+            self._pending[request_id] = future
+        if self.recorder is not None:
+            self.recorder.watch(op, data, future)
+        try:
+            with self._send_lock:
+                self._write(message)
+        except Exception:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            raise
+        return future
+
+    def _encode(self, message: dict):
+        if self.encoding == "msgpack":
+            return self._msgpack.packb(message)
+        return json.dumps(message)
+
+    def _decode(self, message) -> dict:
+        if self.encoding == "msgpack":
+            return self._msgpack.unpackb(message)
+        return json.loads(message)
+
+    def _write(self, message):
+        if isinstance(message, bytes):
+            self.ws.send_binary(message)
+        else:
+            self.ws.send(message)
+
+    def _wait(self, future: Future) -> dict:
+        try:
+            return future.result(self.timeout)
+        except FutureTimeoutError as e:
+            with self._pending_lock:
+                self._pending.pop(future.request_id, None)
+            raise OBSSDKTimeoutError("Timeout while waiting for the response") from e
+
+    def _read(self):
+        while True:
+            try:
+                message = self._decode(self.ws.recv())
+            except Exception as e:
+                self._closed = True
+                self._fail_pending(OBSSDKError(f"The connection to OBS was lost: {e}"))
+                return
+            if message["op"] in (7, 9):
+                with self._pending_lock:
+                    future = self._pending.pop(message["d"]["requestId"], None)
+                if future is not None:
+                    future.set_result(message["d"])
+            elif message["op"] == 5:
+                self._dispatch(message["d"]["eventType"], message["d"].get("eventData", {}))
+
+    def _dispatch(self, event_type: str, event_data: dict):
+        for callback, event_types, _ in self._listeners:
+            if event_types is None or event_type in event_types:
+                try:
+                    callback(event_type, event_data)
+                except Exception:
+                    logger.exception(f"Event listener {callback!r} failed on {event_type}")
+
+    def _update_subscriptions(self):
+        subs = self._base_subs
+        for _, _, listener_subs in self._listeners:
+            subs |= listener_subs
+        if subs != self.subs and not self._closed:
+            self.set_subscriptions(subs)
+
+    def _fail_pending(self, error: Exception):
+        with self._pending_lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for future in pending:
+            if not future.done():
+                future.set_exception(error)
+
+    def _identify(self) -> dict:
+        payload = {"op": 1, "d": {"rpcVersion": 1, "eventSubscriptions": int(self.subs)}}
+        hello = self.server_hello["d"]
+        if "authentication" in hello:
+            if not self.password:
+                raise OBSSDKError("authentication enabled but no password provided")
+            secret = base64.b64encode(hashlib.sha256((self.password + hello["authentication"]["salt"]).encode()).digest())
+            payload["d"]["authentication"] = base64.b64encode(
+                hashlib.sha256(secret + hello["authentication"]["challenge"].encode()).digest()
+            ).decode()
+
+        self._write(self._encode(payload))
+        response = self._decode(self.ws.recv())
+        if response["op"] != 2:
+            raise OBSSDKError("failed to identify client with the server, expected response with OpCode 2")
+        return response["d"]
@@ -0,0 +1,319 @@
+import obsws_python as obs
+import logging
+import threading
+import time
+from collections import OrderedDict
+from itertools import count
+
+logger = logging.getLogger(__name__)
+
+Subs = obs.Subs
+
+EVENT_SUBSCRIPTIONS = {
+    "ExitStarted": Subs.GENERAL,
+    "CustomEvent": Subs.GENERAL,
+    "VendorEvent": Subs.VENDORS,
+    "CurrentSceneCollectionChanging": Subs.CONFIG,
+    "CurrentSceneCollectionChanged": Subs.CONFIG,
+    "SceneCollectionListChanged": Subs.CONFIG,
+    "CurrentProfileChanging": Subs.CONFIG,
+    "CurrentProfileChanged": Subs.CONFIG,
+    "ProfileListChanged": Subs.CONFIG,
+    "SceneCreated": Subs.SCENES,
+    "SceneRemoved": Subs.SCENES,
+    "SceneNameChanged": Subs.SCENES,
+    "CurrentProgramSceneChanged": Subs.SCENES,
+    "CurrentPreviewSceneChanged": Subs.SCENES,
+    "SceneListChanged": Subs.SCENES,
+    "InputCreated": Subs.INPUTS,
+    "InputRemoved": Subs.INPUTS,
+    "InputNameChanged": Subs.INPUTS,
+    "InputSettingsChanged": Subs.INPUTS,
+    "InputMuteStateChanged": Subs.INPUTS,
+    "InputVolumeChanged": Subs.INPUTS,
+    "InputAudioBalanceChanged": Subs.INPUTS,
+    "InputAudioSyncOffsetChanged": Subs.INPUTS,
+    "InputAudioTracksChanged": Subs.INPUTS,
+    "InputAudioMonitorTypeChanged": Subs.INPUTS,
+    "InputActiveStateChanged": Subs.INPUTACTIVESTATECHANGED,
+    "InputShowStateChanged": Subs.INPUTSHOWSTATECHANGED,
+    "InputVolumeMeters": Subs.INPUTVOLUMEMETERS,
+    "CurrentSceneTransitionChanged": Subs.TRANSITIONS,
+    "CurrentSceneTransitionDurationChanged": Subs.TRANSITIONS,
+    "SceneTransitionStarted": Subs.TRANSITIONS,
+    "SceneTransitionEnded": Subs.TRANSITIONS,
+    "SceneTransitionVideoEnded": Subs.TRANSITIONS,
+    "SourceFilterListReindexed": Subs.FILTERS,
+    "SourceFilterCreated": Subs.FILTERS,
+    "SourceFilterRemoved": Subs.FILTERS,
+    "SourceFilterNameChanged": Subs.FILTERS,
+    "SourceFilterSettingsChanged": Subs.FILTERS,
+    "SourceFilterEnableStateChanged": Subs.FILTERS,
+    "StreamStateChanged": Subs.OUTPUTS,
+    "RecordStateChanged": Subs.OUTPUTS,
+    "RecordFileChanged": Subs.OUTPUTS,
+    "ReplayBufferStateChanged": Subs.OUTPUTS,
+    "VirtualcamStateChanged": Subs.OUTPUTS,
+    "ReplayBufferSaved": Subs.OUTPUTS,
+    "SceneItemCreated": Subs.SCENEITEMS,
+    "SceneItemRemoved": Subs.SCENEITEMS,
+    "SceneItemListReindexed": Subs.SCENEITEMS,
+    "SceneItemEnableStateChanged": Subs.SCENEITEMS,
+    "SceneItemLockStateChanged": Subs.SCENEITEMS,
+    "SceneItemSelected": Subs.SCENEITEMS,
+    "SceneItemTransformChanged": Subs.SCENEITEMTRANSFORMCHANGED,
+    "MediaInputPlaybackStarted": Subs.MEDIAINPUTS,
+    "MediaInputPlaybackEnded": Subs.MEDIAINPUTS,
+    "MediaInputActionTriggered": Subs.MEDIAINPUTS,
+    "StudioModeStateChanged": Subs.UI,
+    "ScreenshotSaved": Subs.UI,
+}
+
+NAME_FIELDS = ("inputName", "sceneName", "sourceName", "filterName", "transitionName")
+
+DROP_OLDEST = "drop_oldest"
+COALESCE = "coalesce"
+BLOCK = "block"
+POLICIES = (DROP_OLDEST, COALESCE, BLOCK)
+
+
+def subscriptions_for(event_types: list) -> int:
+    """
+    Returns the eventSubscriptions bitmask needed to receive the given event types.
+
+    :param event_types: A list of event types, or None for all low volume events.
+    :return: The eventSubscriptions bitmask.
+    """
+    if event_types is None:
+        return int(Subs.LOW_VOLUME)
+    subs = 0
+    for event_type in event_types:
+        subs |= EVENT_SUBSCRIPTIONS.get(event_type, 0)
+    return int(subs)
+
+
+def default_key(event_type: str, event_data: dict):
+    """
+    Returns the key used to coalesce events: the event type and the names of the objects it is about.
+    """
+    return (event_type,) + tuple(event_data.get(field) for field in NAME_FIELDS)
+
+
+class Subscription:
+    """
+    A subscriber of an EventBus. Matching events are put on a bounded queue and either handed
+    to a callback on the subscription's own thread or read with get(). When the queue is full,
+    the policy decides what happens:
+
+    - drop_oldest: the oldest queued event is dropped.
+    - coalesce: an event replaces the queued event with the same key in place (e.g. only the latest
+      volume of every input is kept); if there is none, the oldest queued event is dropped.
+    - block: the publisher waits until there is room. This holds up the connection reader and with it
+      the responses to requests on the same connection, so it is best used with lanes, where
+      events arrive on their own connection.
+    """
+
+    def __init__(self, bus: "EventBus", event_types: list = None, names: list = None, callback=None,
+                 maxsize: int = 1024, policy: str = DROP_OLDEST, key=None, subs: int = 0, name: str = None):
+        """
+        Initializes the Subscription. Use EventBus.subscribe() instead of creating it directly.
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {policy}")
+        self.bus = bus
+        self.event_types = set(event_types) if event_types is not None else None
+        self.names = set(names) if names is not None else None
+        self.callback = callback
+        self.maxsize = maxsize
+        self.policy = policy
+        self.key = key or default_key
+        self.subs = subscriptions_for(event_types) | int(subs)
+        self.name = name
+        self.closed = False
+
+        self._queue = OrderedDict()
+        self._ids = count()
+        self._condition = threading.Condition()
+        self._metrics = {"received": 0, "delivered": 0, "dropped": 0, "coalesced": 0, "max_lag": 0.0, "last_lag": 0.0}
+        self._worker = None
+        if callback is not None:
+            self._worker = threading.Thread(target=self._run, daemon=True)
+            self._worker.start()
+
+    def matches(self, event_type: str, event_data: dict) -> bool:
+        """
+        Returns whether an event passes the type and name filters of the subscription.
+        """
+        if self.event_types is not None and event_type not in self.event_types:
+            return False
+        if self.names is not None and not any(event_data.get(field) in self.names for field in NAME_FIELDS):
+            return False
+        return True
+
+    def put(self, event_type: str, event_data: dict):
+        """
+        Queues an event according to the backpressure policy. Called by the EventBus.
+        """
+        entry = (time.monotonic(), event_type, event_data)
+        with self._condition:
+            if self.closed:
+                return
+            self._metrics["received"] += 1
+            if self.policy == COALESCE:
+                key = self.key(event_type, event_data)
+                if key in self._queue:
+                    self._queue[key] = entry
+                    self._metrics["coalesced"] += 1
+                    return
+            else:
+                key = next(self._ids)
+
+            if self.policy == BLOCK:
+                while len(self._queue) >= self.maxsize and not self.closed:
+                    self._condition.wait()
+                if self.closed:
+                    return
+            elif len(self._queue) >= self.maxsize:
+                self._queue.popitem(last=False)
+                self._metrics["dropped"] += 1
+            self._queue[key] = entry
+            self._condition.notify_all()
+
+    def get(self, timeout: float = None) -> tuple:
+        """
+        Returns the next queued event, waiting for one if the queue is empty.
+
+        :param timeout: Optional. Seconds to wait for an event.
+        :return: A tuple with the event type and the event data, or None on timeout or when the subscription is closed.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._queue or self.closed, timeout) or not self._queue:
+                return None
+            _, (received, event_type, event_data) = self._queue.popitem(last=False)
+            lag = time.monotonic() - received
+            self._metrics["delivered"] += 1
+            self._metrics["last_lag"] = lag
+            self._metrics["max_lag"] = max(self._metrics["max_lag"], lag)
+            self._condition.notify_all()
+        return event_type, event_data
+
+    def metrics(self) -> dict:
+        """
+        Returns the metrics of the subscription.
+
+        :return: A dictionary with the number of received, delivered, dropped and coalesced events, the
+                 current queue length, the lag of the oldest queued event and the last and max delivery lag in seconds.
+        """
+        with self._condition:
+            oldest = next(iter(self._queue.values()))[0] if self._queue else None
+            return {
+                **self._metrics,
+                "queued": len(self._queue),
+                "lag": time.monotonic() - oldest if oldest is not None else 0.0,
+            }
+
+    def close(self):
+        """
+        Unsubscribes from the bus and stops the callback thread. Queued events are discarded.
+        """
+        self.bus._remove(self)
+        with self._condition:
+            self.closed = True
+            self._queue.clear()
+            self._condition.notify_all()
+        if self._worker is not None and self._worker is not threading.current_thread():
+            self._worker.join()
+
+    def _run(self):
+        while True:
+            event = self.get()
+            if event is None:
+                return
+            try:
+                self.callback(*event)
+            except Exception:
+                logger.exception(f"Event bus subscriber {self.name or self.callback!r} failed on {event[0]}")
+
+
+class EventBus:
+    """
+    Dispatches OBS events to subscribers, each with its own type and name filters and its own
+    bounded queue, so a slow subscriber only fills its own queue. The eventSubscriptions bitmask
+    of the connection is computed from what the subscribers need and updated with a Reidentify
+    whenever subscribers come and go.
+    """
+
+    def __init__(self, client: obs.ReqClient):
+        """
+        Initializes the EventBus on a client that delivers OBS events.
+
+        :param client: An instance of the OBS WebSocket client with event support, e.g. Client or LaneClient.
+        """
+        if not hasattr(client, "add_event_listener"):
+            raise ValueError("The event bus requires a client that delivers OBS events")
+        self.client = client
+        self._lock = threading.Lock()
+        self._subscriptions = []
+        self._subs = None
+
+    def subscribe(self, event_types: list = None, names: list = None, callback=None, maxsize: int = 1024,
+                  policy: str = DROP_OLDEST, key=None, subs: int = 0, name: str = None) -> Subscription:
+        """
+        Adds a subscriber.
+
+        :param event_types: Optional. The event types to receive. All low volume events if not specified.
+        :param names: Optional. Only receive events about inputs, scenes, sources, filters or transitions with these names.
+        :param callback: Optional. A callable that takes the event type and the event data, called on the
+                         subscription's own thread. Without a callback, read the events with Subscription.get().
+        :param maxsize: The maximum number of queued events.
+        :param policy: What to do when the queue is full: 'drop_oldest', 'coalesce' or 'block'.
+        :param key: Optional. For 'coalesce', a callable that takes the event type and data and returns the coalescing key.
+        :param subs: Optional. Extra eventSubscriptions bits, e.g. Subs.INPUTVOLUMEMETERS when event_types is not specified.
+        :param name: Optional. A name for the subscription in metrics().
+        :return: The Subscription.
+        """
+        subscription = Subscription(self, event_types, names, callback, maxsize, policy, key, subs, name)
+        with self._lock:
+            self._subscriptions = self._subscriptions + [subscription]
+            self._update_subscriptions()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """
+        Removes a subscriber. Same as Subscription.close().
+
+        :param subscription: The Subscription to remove.
+        """
+        subscription.close()
+
+    def metrics(self) -> dict:
+        """
+        Returns the metrics of every subscriber.
+
+        :return: A dictionary mapping the name of every subscription (or its index) to its metrics.
+        """
+        subscriptions = self._subscriptions
+        return {subscription.name or str(index): subscription.metrics() for index, subscription in enumerate(subscriptions)}
+
+    def _remove(self, subscription: Subscription):
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions = [other for other in self._subscriptions if other is not subscription]
+                self._update_subscriptions()
+
+    def _update_subscriptions(self):
+        subs = 0
+        for subscription in self._subscriptions:
+            subs |= subscription.subs
+        if subs == self._subs:
+            return
+        self._subs = subs
+        if self._subscriptions:
+            self.client.add_event_listener(self._publish, None, subs)
+        else:
+            self.client.remove_event_listener(self._publish)
+
+    def _publish(self, event_type: str, event_data: dict):
+        for subscription in self._subscriptions:
+            if subscription.matches(event_type, event_data):
+                subscription.put(event_type, event_data)
@@ -1,10 +1,24 @@
 import obsws_python as obs
-from .__utils import get_attributes_as_dict
+import threading
+from .__utils import get_attributes_as_dict, with_priority
+from .metadata_cache import MetadataCache, memoized
+
+SETTINGS_EVENTS = [
+    "SourceFilterSettingsChanged", "SourceFilterNameChanged", "SourceFilterRemoved",
+    "InputNameChanged", "SceneNameChanged", "CurrentSceneCollectionChanged",
+]
 
 class FilterController:
 
-    def __init__(self, obs_controller: obs.ReqClient):
-        self.client = obs_controller
+    def __init__(self, obs_controller: obs.ReqClient, priority: str = None, metadata_cache: MetadataCache = None):
+        self.client = with_priority(obs_controller, priority)
+        self._lock = threading.Lock()
+        self._settings = {}
+        self.metadata_cache = metadata_cache or MetadataCache()
+        self.metadata_cache.watch(self.client)
+        self._caching = hasattr(self.client, "add_event_listener")
+        if self._caching:
+            self.client.add_event_listener(self._on_event, SETTINGS_EVENTS, obs.Subs.FILTERS | obs.Subs.INPUTS | obs.Subs.SCENES | obs.Subs.CONFIG)
 
     def get_list(self, source_name: str) -> list:
         """
@@ -15,10 +29,13 @@ class FilterController:
         """
         return self.client.get_source_filter_list(source_name).filters
 
+    @memoized
     def get_default_settings(self, filter_kind: str):
         """
         Retrieves the default settings for a specified filter.
 
+        The result is kept in the metadata cache.
+
         :param filter_kind: The type of filter to retrieve default settings for.
         :return: A dictionary containing the default settings for the filter.
         """
@@ -62,7 +79,11 @@ class FilterController:
         :param filter_name: The name of the filter to retrieve settings for.
         :return: A dictionary containing the current settings for the filter.
         """
-        return get_attributes_as_dict(self.client.get_source_filter(source_name, filter_name))
+        data = get_attributes_as_dict(self.client.get_source_filter(source_name, filter_name))
+        if self._caching:
+            with self._lock:
+                self._settings[(source_name, filter_name)] = (data["filter_kind"], dict(data["filter_settings"]))
+        return data
 
     def set_index(self, source_name: str, filter_name: str, filter_index: int):
         """
@@ -83,6 +104,55 @@ class FilterController:
         :param filter_settings: A dictionary containing the new settings for the filter.
         """
         self.client.set_source_filter_settings(source_name, filter_name, filter_settings, overlay)
+        with self._lock:
+            if (source_name, filter_name) in self._settings:
+                filter_kind, settings = self._settings[(source_name, filter_name)]
+                settings = {**settings, **filter_settings} if overlay else dict(filter_settings)
+                self._settings[(source_name, filter_name)] = (filter_kind, settings)
+
+    def patch_settings(self, source_name: str, filter_name: str, filter_settings: dict, validate: bool = False) -> dict:
+        """
+        Updates the settings of a filter, sending only the keys whose value differs from the
+        cached settings. The settings of the filter are requested once and then kept up to
+        date from SourceFilterSettingsChanged events. Nothing is sent if nothing changed.
+
+        :param source_name: The name of the source the filter is attached to.
+        :param filter_name: The name of the filter to update the settings of.
+        :param filter_settings: A dictionary containing the new settings for the filter.
+        :param validate: True to raise a ValueError for keys that are not settings of the filter kind.
+        :return: A dictionary with the settings that were sent.
+        """
+        with self._lock:
+            cached = self._settings.get((source_name, filter_name))
+        if cached is None:
+            data = self.get(source_name, filter_name)
+            cached = (data["filter_kind"], data["filter_settings"])
+        filter_kind, settings = cached
+
+        if validate:
+            unknown = set(filter_settings) - set(self.get_default_settings(filter_kind)) - set(settings)
+            if unknown:
+                raise ValueError(f"Unknown settings for filter kind {filter_kind}: {', '.join(sorted(unknown))}")
+
+        changed = {key: value for key, value in filter_settings.items() if key not in settings or settings[key] != value}
+        if changed:
+            self.set_settings(source_name, filter_name, changed)
+        return changed
+
+    def _on_event(self, event_type: str, event_data: dict):
+        with self._lock:
+            if event_type == "SourceFilterSettingsChanged":
+                key = (event_data["sourceName"], event_data["filterName"])
+                if key in self._settings:
+                    self._settings[key] = (self._settings[key][0], event_data["filterSettings"])
+            elif event_type == "SourceFilterNameChanged":
+                key = (event_data["sourceName"], event_data["oldFilterName"])
+                if key in self._settings:
+                    self._settings[(event_data["sourceName"], event_data["filterName"])] = self._settings.pop(key)
+            elif event_type == "SourceFilterRemoved":
+                self._settings.pop((event_data["sourceName"], event_data["filterName"]), None)
+            else:
+                self._settings.clear()
     
     def get_enabled(self, source_name: str, filter_name: str) -> bool:
         """
@@ -1,14 +1,18 @@
 import obsws_python as obs
-from .__utils import get_attributes_as_dict
+from .__utils import get_attributes_as_dict, with_priority
+from .metadata_cache import MetadataCache, memoized
 
 class GeneralController:
 
-    def __init__(self, obs_controller: obs.ReqClient):
-        self.client = obs_controller
+    def __init__(self, obs_controller: obs.ReqClient, priority: str = None, metadata_cache: MetadataCache = None):
+        self.client = with_priority(obs_controller, priority)
+        self.metadata_cache = metadata_cache or MetadataCache()
+        self.metadata_cache.watch(self.client)
 
+    @memoized
     def get_version(self):
         """
-        Returns the version of the OBS server.
+        Returns the version of the OBS server. The result is kept in the metadata cache.
         
         :return: A dictionary containing the version information.
         """
@@ -47,6 +51,7 @@ class GeneralController:
         :param profile_name: The name of the new profile.
         """
         self.client.create_profile(profile_name)
+        self.metadata_cache.invalidate("GeneralController.get_profile_list")
     
     def remove_profile(self, profile_name: str):
         """
@@ -55,10 +60,13 @@ class GeneralController:
         :param profile_name: The name of the profile to remove.
         """
         self.client.remove_profile(profile_name)
+        self.metadata_cache.invalidate("GeneralController.get_profile_list")
     
+    @memoized
     def get_profile_list(self):
         """
-        Returns a list of all profiles in OBS.
+        Returns a list of all profiles in OBS. The result is kept in the metadata cache
+        until OBS reports a change of the profile list.
         
         :return: A list of profiles.
         """
@@ -72,9 +80,11 @@ class GeneralController:
         """
         self.client.set_current_profile(profile_name)
     
+    @memoized
     def get_scene_collection_list(self):
         """
-        Returns a list of all scene collections in OBS.
+        Returns a list of all scene collections in OBS. The result is kept in the metadata
+        cache until OBS reports a change of the scene collection list.
         
         :return: A list of scene collections.
         """
@@ -87,6 +97,7 @@ class GeneralController:
         :param scene_collection_name: The name of the new scene collection.
         """
         self.client.create_scene_collection(scene_collection_name)
+        self.metadata_cache.invalidate("GeneralController.get_scene_collection_list")
     
     def set_current_scene_collection(self, scene_collection_name: str):
         """
@@ -1,4 +1,10 @@
 import obsws_python as obs
+import threading
+from .__utils import with_priority
+from .metadata_cache import MetadataCache, memoized
+
+SETTINGS_EVENTS = ["InputSettingsChanged", "InputNameChanged", "InputRemoved", "CurrentSceneCollectionChanged"]
+
 
 class InputController:
     """
@@ -8,13 +14,22 @@ class InputController:
     settings and properties.
     """
 
-    def __init__(self, obs_controller: obs.ReqClient):
+    def __init__(self, obs_controller: obs.ReqClient, priority: str = None, metadata_cache: MetadataCache = None):
         """
         Initializes the InputController with a reference to the OBS WebSocket client.
         
         :param obs_controller: An instance of the OBS WebSocket client.
-        """
-        self.client = obs_controller
+        :param priority: Optional. The priority class of the requests when the client goes through a RequestScheduler.
+        :param metadata_cache: Optional. The cache for kinds and default settings. A new one is created if not specified.
+        """
+        self.client = with_priority(obs_controller, priority)
+        self._lock = threading.Lock()
+        self._settings = {}
+        self.metadata_cache = metadata_cache or MetadataCache()
+        self.metadata_cache.watch(self.client)
+        self._caching = hasattr(self.client, "add_event_listener")
+        if self._caching:
+            self.client.add_event_listener(self._on_event, SETTINGS_EVENTS, obs.Subs.INPUTS | obs.Subs.CONFIG)
     
     def get_list(self) -> list:
         """
@@ -24,11 +39,12 @@ class InputController:
         """
         return self.client.get_input_list().inputs
     
+    @memoized
     def get_kind_list(self) -> list:
         """
         Returns a list of all available input source kinds in OBS. Input source kinds
         include types such as video capture devices, audio input/output captures, image
-        sources, text sources, and more.
+        sources, text sources, and more. The result is kept in the metadata cache.
         
         :return: A list of input source kinds.
         """
@@ -64,9 +80,11 @@ class InputController:
         """
         self.client.set_input_name(old_name, new_name)
     
+    @memoized
     def get_default_settings(self, input_kind: str) -> dict:
         """
-        Retrieves the default settings for a particular input source kind.
+        Retrieves the default settings for a particular input source kind. The result is kept in
+        the metadata cache.
 
         :param input_kind: The kind of the input source (e.g., 'video_capture_device', 'audio_input_capture').
         :return: A dictionary containing the default settings for the input source kind.
@@ -80,7 +98,9 @@ class InputController:
         :param input_name: The name of the input source to retrieve settings for.
         :return: A dictionary containing the current settings for the input source.
         """
-        return self.client.get_input_settings(input_name).input_settings
+        data = self.client.get_input_settings(input_name)
+        self._cache_settings(input_name, data.input_kind, data.input_settings)
+        return data.input_settings
 
     def get_kind(self, input_name: str) -> str:
         """
@@ -99,6 +119,58 @@ class InputController:
         :param input_settings: A dictionary containing the new settings for the input source.
         """
         self.client.set_input_settings(input_name, input_settings, True)
+        with self._lock:
+            if input_name in self._settings:
+                input_kind, settings = self._settings[input_name]
+                self._settings[input_name] = (input_kind, {**settings, **input_settings})
+
+    def patch_settings(self, input_name: str, input_settings: dict, validate: bool = False) -> dict:
+        """
+        Updates the settings of an input source, sending only the keys whose value differs from
+        the cached settings. The settings of the input are requested once and then kept up to
+        date from InputSettingsChanged events. Nothing is sent if nothing changed.
+
+        :param input_name: The name of the input source to update the settings of.
+        :param input_settings: A dictionary containing the new settings for the input source.
+        :param validate: True to raise a ValueError for keys that are not settings of the input kind.
+        :return: A dictionary with the settings that were sent.
+        """
+        with self._lock:
+            cached = self._settings.get(input_name)
+        if cached is None:
+            data = self.client.get_input_settings(input_name)
+            self._cache_settings(input_name, data.input_kind, data.input_settings)
+            cached = (data.input_kind, data.input_settings)
+        input_kind, settings = cached
+
+        if validate:
+            unknown = set(input_settings) - set(self.get_default_settings(input_kind)) - set(settings)
+            if unknown:
+                raise ValueError(f"Unknown settings for input kind {input_kind}: {', '.join(sorted(unknown))}")
+
+        changed = {key: value for key, value in input_settings.items() if key not in settings or settings[key] != value}
+        if changed:
+            self.set_settings(input_name, changed)
+        return changed
+
+    def _cache_settings(self, input_name: str, input_kind: str, input_settings: dict):
+        if self._caching:
+            with self._lock:
+                self._settings[input_name] = (input_kind, dict(input_settings))
+
+    def _on_event(self, event_type: str, event_data: dict):
+        with self._lock:
+            if event_type == "InputSettingsChanged":
+                if event_data["inputName"] in self._settings:
+                    input_kind = self._settings[event_data["inputName"]][0]
+                    self._settings[event_data["inputName"]] = (input_kind, event_data["inputSettings"])
+            elif event_type == "InputNameChanged":
+                if event_data["oldInputName"] in self._settings:
+                    self._settings[event_data["inputName"]] = self._settings.pop(event_data["oldInputName"])
+            elif event_type == "InputRemoved":
+                self._settings.pop(event_data["inputName"], None)
+            else:
+                self._settings.clear()
 
     def get_volume(self, input_name: str) -> float:
         """
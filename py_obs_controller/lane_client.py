@@ -0,0 +1,146 @@
+import obsws_python as obs
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from .client import Client
+from .__utils import latency_summary
+
+CONTROL_LANE = "control"
+BULK_LANE = "bulk"
+EVENTS_LANE = "events"
+
+DEFAULT_LANE_MAPPING = {
+    BULK_LANE: [
+        "GetSourceScreenshot", "SaveSourceScreenshot", "GetSceneItemList", "GetGroupSceneItemList",
+        "GetInputList", "GetSceneList", "GetInputSettings", "GetInputKindList", "GetStats",
+    ],
+}
+
+
+class LaneClient(obs.ReqClient):
+    """
+    An OBS WebSocket client that opens several authenticated connections (lanes) to the same
+    OBS instance and routes every request to a lane by its request type. Large responses such
+    as screenshots and big lists travel on the bulk lane, so they cannot hold up latency
+    critical requests like scene cuts on the control lane at the TCP level. Events are
+    received on their own events lane.
+
+    The latency of the requests on every lane is measured, see latency_stats().
+    """
+
+    def __init__(self, host: str, port: int, password: str, lane_mapping: dict = None, timeout: float = None, subs: int = 0, encoding: str = "json"):
+        """
+        Initializes the LaneClient and opens one connection per lane.
+
+        :param host: The IP address or hostname of the OBS WebSocket server.
+        :param port: The port number for the OBS WebSocket server.
+        :param password: The password for the OBS WebSocket server.
+        :param lane_mapping: Optional. A dictionary mapping a lane name to the request types sent on it.
+                             Request types that are not mapped use the control lane. DEFAULT_LANE_MAPPING if not specified.
+        :param timeout: Optional. Seconds to wait for the connections and for every response.
+        :param subs: Optional. The eventSubscriptions bitmask of the events lane.
+        :param encoding: Optional. 'json' or 'msgpack'. See Connection.
+        """
+        lane_mapping = DEFAULT_LANE_MAPPING if lane_mapping is None else lane_mapping
+        self.routes = {}
+        for lane, request_types in lane_mapping.items():
+            for request_type in request_types:
+                self.routes[request_type] = lane
+
+        names = {CONTROL_LANE, EVENTS_LANE} | set(lane_mapping)
+        self.lanes = {}
+        try:
+            for name in sorted(names):
+                self.lanes[name] = Client(host, port, password, timeout, subs if name == EVENTS_LANE else 0, encoding)
+        except BaseException:
+            self.disconnect()
+            raise
+        self.base_client = self.lanes[CONTROL_LANE].base_client
+
+        self._lock = threading.Lock()
+        self._latencies = {name: deque(maxlen=4096) for name in self.lanes}
+
+    def lane_for(self, request_type: str) -> str:
+        """
+        Returns the lane a request type is sent on.
+
+        :param request_type: The obs-websocket request type, e.g. 'GetSourceScreenshot'.
+        :return: The name of the lane.
+        """
+        return self.routes.get(request_type, CONTROL_LANE)
+
+    def latency_stats(self) -> dict:
+        """
+        Returns the request latency of every lane over its last 4096 requests.
+
+        :return: A dictionary mapping every lane to a dictionary with the request count and the
+                 mean, p50, p95, p99 and max latency in seconds.
+        """
+        with self._lock:
+            samples = {lane: list(latencies) for lane, latencies in self._latencies.items()}
+        return {lane: latency_summary(latencies) for lane, latencies in samples.items()}
+
+    def add_event_listener(self, callback, event_types: list = None, subs: int = 0):
+        """
+        Registers a callback for OBS events received on the events lane.
+
+        :param callback: A callable that takes the event type and the event data.
+        :param event_types: Optional. The event types to receive. All events if not specified.
+        :param subs: Optional. Event subscription bits the callback needs.
+        """
+        self.lanes[EVENTS_LANE].add_event_listener(callback, event_types, subs)
+
+    def remove_event_listener(self, callback):
+        """
+        Removes a callback registered with add_event_listener.
+
+        :param callback: The callback to remove.
+        """
+        self.lanes[EVENTS_LANE].remove_event_listener(callback)
+
+    def disconnect(self):
+        for lane in self.lanes.values():
+            lane.disconnect()
+
+    def send(self, param, data=None, raw=False):
+        lane = self.lane_for(param)
+        started = time.monotonic()
+        try:
+            return self.lanes[lane].send(param, data, raw)
+        finally:
+            self._record(lane, time.monotonic() - started)
+
+    def send_async(self, param, data=None, raw=False) -> Future:
+        """
+        Sends a request on its lane without waiting for its response. See Client.send_async.
+        """
+        lane = self.lane_for(param)
+        started = time.monotonic()
+        future = self.lanes[lane].send_async(param, data, raw)
+        future.add_done_callback(lambda _: self._record(lane, time.monotonic() - started))
+        return future
+
+    def send_batch(self, requests: list, halt_on_failure: bool = False, execution_type: int = 0) -> list:
+        """
+        Sends several requests as one RequestBatch message. The batch goes on the bulk lane if any of
+        its requests is mapped to a lane other than control, and on the control lane otherwise.
+
+        :param requests: A list of (request_type, request_data) tuples.
+        :param halt_on_failure: Whether OBS should stop processing the batch after the first failed request.
+        :param execution_type: 0 for serial realtime, 1 for serial frame, 2 for parallel.
+        :return: A list with the raw result of every executed request, in order.
+        """
+        lanes = {self.lane_for(request_type) for request_type, _ in requests} - {CONTROL_LANE}
+        lane = CONTROL_LANE
+        if lanes:
+            lane = BULK_LANE if BULK_LANE in lanes and BULK_LANE in self.lanes else sorted(lanes)[0]
+        started = time.monotonic()
+        try:
+            return self.lanes[lane].send_batch(requests, halt_on_failure, execution_type)
+        finally:
+            self._record(lane, time.monotonic() - started)
+
+    def _record(self, lane: str, latency: float):
+        with self._lock:
+            self._latencies[lane].append(latency)
@@ -0,0 +1,133 @@
+import copy
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+
+import obsws_python as obs
+
+INVALIDATING_EVENTS = {
+    "ProfileListChanged": ["GeneralController.get_profile_list"],
+    "SceneCollectionListChanged": ["GeneralController.get_scene_collection_list"],
+}
+
+
+class MetadataCache:
+    """
+    A TTL and LRU bounded cache for controller methods that return OBS metadata which almost
+    never changes, such as the OBS version, input kinds and default settings. Entries expire
+    after their TTL, the least recently used entry is evicted when the cache is full, and
+    entries are invalidated by OBS events where OBS reports a change.
+
+    Set MetadataCache.bypass to True to disable every MetadataCache at once.
+    """
+
+    bypass = False
+
+    def __init__(self, ttl: float = 300.0, max_size: int = 256, ttls: dict = None):
+        """
+        Initializes the MetadataCache.
+
+        :param ttl: Seconds an entry stays valid. None for no expiry.
+        :param max_size: The maximum number of entries.
+        :param ttls: Optional. A dictionary mapping a qualified method name, e.g. 'GeneralController.get_version',
+                     to its own TTL in seconds.
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.ttls = ttls or {}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._watched = set()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+
+    def get(self, name: str, args: tuple, loader):
+        """
+        Returns the cached result of a method call, calling the loader on a miss.
+
+        :param name: The qualified name of the method, e.g. 'GeneralController.get_version'.
+        :param args: The arguments of the call. Must be hashable.
+        :param loader: A callable without arguments that returns the fresh result.
+        :return: A deep copy of the cached result, so callers can change it freely.
+        """
+        if MetadataCache.bypass:
+            return loader()
+
+        key = (name, args)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] is None or entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return copy.deepcopy(entry[1])
+                del self._entries[key]
+                self._stats["expirations"] += 1
+            self._stats["misses"] += 1
+
+        value = loader()
+        ttl = self.ttls.get(name, self.ttl)
+        with self._lock:
+            self._entries[key] = (now + ttl if ttl is not None else None, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+        return copy.deepcopy(value)
+
+    def invalidate(self, name: str = None):
+        """
+        Removes cached entries.
+
+        :param name: Optional. The qualified name of the method whose entries are removed. All entries if not specified.
+        """
+        with self._lock:
+            keys = [key for key in self._entries if name is None or key[0] == name]
+            for key in keys:
+                del self._entries[key]
+            self._stats["invalidations"] += len(keys)
+
+    def stats(self) -> dict:
+        """
+        Returns the cache statistics.
+
+        :return: A dictionary with the number of hits, misses, evictions, expirations and invalidations, and the current size.
+        """
+        with self._lock:
+            return {**self._stats, "size": len(self._entries)}
+
+    def watch(self, client: obs.ReqClient):
+        """
+        Invalidates entries from the events of a client. Does nothing if the client does not
+        deliver events or is already watched.
+
+        :param client: An instance of the OBS WebSocket client.
+        """
+        if not hasattr(client, "add_event_listener") or id(client) in self._watched:
+            return
+        self._watched.add(id(client))
+        client.add_event_listener(self._on_event, list(INVALIDATING_EVENTS), obs.Subs.CONFIG)
+
+    def _on_event(self, event_type: str, event_data: dict):
+        for name in INVALIDATING_EVENTS.get(event_type, []):
+            self.invalidate(name)
+
+
+def memoized(method):
+    """
+    Decorates a controller method so its results are stored in the controller's metadata_cache.
+    Positional and keyword arguments are bound to the method's signature, so equivalent calls
+    share an entry.
+    """
+    name = method.__qualname__
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = tuple(bound.arguments.values())[1:]
+        return self.metadata_cache.get(name, key, lambda: method(*bound.args, **bound.kwargs))
+    return wrapper
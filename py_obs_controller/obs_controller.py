@@ -1,4 +1,4 @@
-import obsws_python as obs
+from contextlib import nullcontext
 
 from .input_controller import InputController
 from .scene_controller import SceneController
@@ -8,6 +8,16 @@ from .record_controller import RecordController
 from .source_controller import SourceController
 from .filter_controller import FilterController
 from .general_controller import GeneralController
+from .timeline_controller import TimelineController
+from .catalog_controller import CatalogController
+from .event_bus import EventBus
+from .client import Client
+from .lane_client import LaneClient
+from .metadata_cache import MetadataCache
+from .request_scheduler import RequestScheduler, CONTROL, INTERACTIVE
+from .traffic_recorder import TrafficRecorder
+
+CONTROLLERS = ["source", "record", "stream", "filters", "general", "virtual_camera", "scenes", "inputs", "timeline", "catalog"]
 
 
 class ObsController:
@@ -17,9 +27,10 @@ class ObsController:
     recording, streaming, and the virtual camera.
     """
 
-    def __init__(self, host: str, port: int, password: str):
+    def __init__(self, host: str, port: int, password: str, priority_scheduling: bool = False, rate_limits: dict = None, metadata_cache: MetadataCache = None, encoding: str = "json", lanes: bool = False, lane_mapping: dict = None, record_traffic: str = None):
         """
         Initializes the ObsController with a connection to the OBS WebSocket server.
+        The connection can be shared by any number of threads.
         
         - source: A controller for managing OBS sources.
         - record: A controller for managing OBS recording.
@@ -29,18 +40,71 @@ class ObsController:
         - virtual_camera: A controller for managing the OBS virtual camera.
         - scenes: A controller for managing OBS scenes.
         - inputs: A controller for managing OBS input sources.
+        - timeline: A controller for running timed cue lists.
+        - catalog: An indexed catalog of inputs, scenes and scene items kept up to date from OBS events.
+        - events: An event bus for subscribing to OBS events with filters and bounded queues.
+
+        Only the events the controllers and the event bus subscribers need are subscribed to.
         
         :param host: The IP address or hostname of the OBS WebSocket server.
         :param port: The port number for the OBS WebSocket server.
         :param password: The password for the OBS WebSocket server.
+        :param priority_scheduling: Optional. True to send every request through a RequestScheduler. Scene,
+                                    stream, record, virtual camera and timeline requests are sent as control
+                                    traffic, everything else as interactive traffic.
+        :param rate_limits: Optional. Per priority class rate limits for the RequestScheduler.
+        :param metadata_cache: Optional. The MetadataCache shared by the controllers for static OBS metadata.
+        :param encoding: Optional. 'json', or 'msgpack' for the MessagePack wire encoding with fallback to JSON
+                         when the server does not support it. msgpack requires the msgpack package.
+        :param lanes: Optional. True to open separate connections for control, bulk and event traffic,
+                      see LaneClient. Per lane latency is available from client.latency_stats().
+        :param lane_mapping: Optional. A dictionary mapping a lane name to the request types sent on it.
+        :param record_traffic: Optional. The path of a file to record every controller method call, request and
+                               response to, see TrafficRecorder. Replay it with TrafficReplayer.
         """
-        self.client = obs.ReqClient(host=host, port=port, password=password)
+        if lanes:
+            self.client = LaneClient(host, port, password, lane_mapping, encoding=encoding)
+        else:
+            self.client = Client(host, port, password, encoding=encoding)
+        self.recorder = None
+        if record_traffic is not None:
+            self.recorder = TrafficRecorder(record_traffic)
+            for lane in (self.client.lanes.values() if lanes else [self.client]):
+                lane.base_client.recorder = self.recorder
+        self.scheduler = None
+        self.metadata_cache = metadata_cache or MetadataCache()
+        client = self.client
+        control = None
+        if priority_scheduling:
+            self.scheduler = RequestScheduler(self.client, rate_limits)
+            client = self.scheduler.client_for(INTERACTIVE)
+            control = CONTROL
         
-        self.source = SourceController(self.client)
-        self.record = RecordController(self.client)
-        self.stream = StreamController(self.client)
-        self.filters = FilterController(self.client)
-        self.general = GeneralController(self.client)
-        self.virtual_camera = VirtualCameraController(self.client)
-        self.scenes = SceneController(self.client)
-        self.inputs = InputController(self.client)
+        self.source = SourceController(client)
+        self.record = RecordController(client, control)
+        self.stream = StreamController(client, control)
+        self.filters = FilterController(client, metadata_cache=self.metadata_cache)
+        self.general = GeneralController(client, metadata_cache=self.metadata_cache)
+        self.virtual_camera = VirtualCameraController(client, control)
+        self.scenes = SceneController(client, control)
+        self.inputs = InputController(client, metadata_cache=self.metadata_cache)
+        self.timeline = TimelineController(client, priority=control)
+        self.catalog = CatalogController(client)
+        self.events = EventBus(self.client)
+        if self.recorder is not None:
+            for name in CONTROLLERS:
+                self.recorder.instrument(getattr(self, name), name)
+
+    def priority(self, priority: str):
+        """
+        Returns a context manager that sends every request made by the current thread within
+        the block with the given priority class. Does nothing without priority scheduling.
+
+        Example: `with obs_controller.priority("background"): obs_controller.source.get_screenshot(...)`
+
+        :param priority: The priority class: 'control', 'interactive' or 'background'.
+        :return: A context manager.
+        """
+        if self.scheduler is None:
+            return nullcontext()
+        return self.scheduler.priority(priority)
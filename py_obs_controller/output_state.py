@@ -0,0 +1,125 @@
+import obsws_python as obs
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from obsws_python.error import OBSSDKError, OBSSDKTimeoutError
+
+STARTED = "OBS_WEBSOCKET_OUTPUT_STARTED"
+STOPPED = "OBS_WEBSOCKET_OUTPUT_STOPPED"
+PAUSED = "OBS_WEBSOCKET_OUTPUT_PAUSED"
+RESUMED = "OBS_WEBSOCKET_OUTPUT_RESUMED"
+
+FAILURE_STATES = {
+    STARTED: {STOPPED},
+    PAUSED: {STOPPED},
+    RESUMED: {STOPPED},
+    STOPPED: {STARTED},
+}
+
+
+class OutputStateError(OBSSDKError):
+    """
+    Raised when an output reaches a state other than the one waited for, e.g. a stream that
+    stops because it failed to start.
+    """
+
+    def __init__(self, event_type: str, expected: str, event_data: dict):
+        self.event_type = event_type
+        self.expected = expected
+        self.event_data = event_data
+        super().__init__(f"{event_type} reported {event_data.get('outputState')} while waiting for {expected}")
+
+
+class OutputStateWaiter:
+    """
+    Waits for an OBS output (record, stream or virtual camera) to reach a state, using the
+    output's state changed event instead of polling its status. Waiting fails with an
+    OutputStateError when the output reaches the opposite state instead, e.g. when it stops
+    because it failed to start.
+    """
+
+    def __init__(self, client: obs.ReqClient, event_type: str):
+        """
+        Initializes the OutputStateWaiter and starts listening for the state changed event.
+
+        :param client: An instance of the OBS WebSocket client.
+        :param event_type: The state changed event of the output, e.g. 'RecordStateChanged'.
+        """
+        self.client = client
+        self.event_type = event_type
+        self._lock = threading.Lock()
+        self._waiting = []
+        self.supported = hasattr(client, "add_event_listener")
+        if self.supported:
+            client.add_event_listener(self._on_event, [event_type], obs.Subs.OUTPUTS)
+
+    def run(self, request, state: str, timeout: float = None) -> dict:
+        """
+        Sends a request and waits until the output reaches the given state.
+
+        :param request: A callable without arguments that sends the request, e.g. client.start_record.
+        :param state: The state to wait for, e.g. 'OBS_WEBSOCKET_OUTPUT_STARTED'.
+        :param timeout: Optional. Seconds to wait for the state.
+        :return: A dictionary with the output_active, output_state and output_path (if any) reported by
+                 OBS, and the seconds elapsed between sending the request and the state change.
+        :raises OutputStateError: If the output reaches the opposite state, e.g. stopped while waiting for started.
+        """
+        future = self._expect(state)
+        try:
+            request()
+            return future.result(timeout)
+        except FutureTimeoutError as e:
+            raise OBSSDKTimeoutError(f"Timeout while waiting for {self.event_type} with state {state}") from e
+        finally:
+            self._discard(future)
+
+    async def run_async(self, request, state: str, timeout: float = None) -> dict:
+        """
+        Sends a request and waits until the output reaches the given state without blocking the event loop.
+
+        :param request: A callable without arguments that sends the request, e.g. client.start_record.
+        :param state: The state to wait for, e.g. 'OBS_WEBSOCKET_OUTPUT_STARTED'.
+        :param timeout: Optional. Seconds to wait for the state.
+        :return: The same dictionary as run().
+        """
+        future = self._expect(state)
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, request)
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError as e:
+            raise OBSSDKTimeoutError(f"Timeout while waiting for {self.event_type} with state {state}") from e
+        finally:
+            self._discard(future)
+
+    def _expect(self, state: str) -> Future:
+        if not self.supported:
+            raise ValueError("Waiting for an output state requires a client that delivers OBS events")
+        future = Future()
+        with self._lock:
+            self._waiting.append((state, time.monotonic(), future))
+        return future
+
+    def _discard(self, future: Future):
+        with self._lock:
+            self._waiting = [waiting for waiting in self._waiting if waiting[2] is not future]
+
+    def _on_event(self, event_type: str, event_data: dict):
+        now = time.monotonic()
+        state = event_data.get("outputState")
+        with self._lock:
+            matched = [waiting for waiting in self._waiting
+                       if waiting[0] == state or state in FAILURE_STATES.get(waiting[0], ())]
+            self._waiting = [waiting for waiting in self._waiting if waiting not in matched]
+        for expected, started, future in matched:
+            if future.done():
+                continue
+            if expected != state:
+                future.set_exception(OutputStateError(event_type, expected, event_data))
+                continue
+            future.set_result({
+                "output_active": event_data.get("outputActive"),
+                "output_state": state,
+                "output_path": event_data.get("outputPath"),
+                "elapsed": now - started,
+            })
@@ -1,15 +1,18 @@
 import obsws_python as obs
-from .__utils import get_attributes_as_dict
+from .__utils import get_attributes_as_dict, with_priority
+from .output_state import OutputStateWaiter, PAUSED, RESUMED, STARTED, STOPPED
 
 class RecordController:
     
-    def __init__(self, obs_controller: obs.ReqClient):
+    def __init__(self, obs_controller: obs.ReqClient, priority: str = None):
         """
         Constructor for the RecordController class.
 
         :param obs_controller: An instance of the obs.ReqClient class for communicating with the OBS WebSocket server.
+        :param priority: Optional. The priority class of the requests when the client goes through a RequestScheduler.
         """
-        self.client = obs_controller
+        self.client = with_priority(obs_controller, priority)
+        self._states = OutputStateWaiter(self.client, "RecordStateChanged")
         
     def get_status(self) -> dict:
         """
@@ -25,17 +28,51 @@ class RecordController:
         """
         self.client.toggle_record()
         
-    def start(self):
+    def start(self, wait: bool = False, timeout: float = 10.0) -> dict:
         """
         Starts the recording.
+
+        :param wait: True to block until OBS reports the recording as started through RecordStateChanged.
+        :param timeout: Seconds to wait when wait is True.
+        :return: With wait, a dictionary with output_active, output_state, output_path and the
+                 elapsed seconds until the state change. None otherwise.
+        """
+        if not wait:
+            self.client.start_record()
+            return None
+        return self._states.run(self.client.start_record, STARTED, timeout)
+
+    async def start_async(self, timeout: float = 10.0) -> dict:
+        """
+        Starts the recording. Resolves when OBS reports the recording as started, without polling.
+
+        :param timeout: Seconds to wait for the state change.
+        :return: A dictionary with output_active, output_state, output_path and the elapsed seconds until the state change.
         """
-        self.client.start_record()
+        return await self._states.run_async(self.client.start_record, STARTED, timeout)
 
-    def stop(self):
+    def stop(self, wait: bool = False, timeout: float = 10.0) -> dict:
         """
         Stops the recording.
+
+        :param wait: True to block until OBS reports the recording as stopped through RecordStateChanged.
+        :param timeout: Seconds to wait when wait is True.
+        :return: With wait, a dictionary with output_active, output_state, output_path and the
+                 elapsed seconds until the state change. None otherwise.
+        """
+        if not wait:
+            self.client.stop_record()
+            return None
+        return self._states.run(self.client.stop_record, STOPPED, timeout)
+
+    async def stop_async(self, timeout: float = 10.0) -> dict:
+        """
+        Stops the recording. Resolves when OBS reports the recording as stopped, without polling.
+
+        :param timeout: Seconds to wait for the state change.
+        :return: A dictionary with output_active, output_state, output_path and the elapsed seconds until the state change.
         """
-        self.client.stop_record()
+        return await self._states.run_async(self.client.stop_record, STOPPED, timeout)
 
     def toggle_pause(self):
         """
@@ -43,17 +80,51 @@ class RecordController:
         """
         self.client.toggle_record_pause()
 
-    def pause(self):
+    def pause(self, wait: bool = False, timeout: float = 10.0) -> dict:
         """
         Pauses the recording.
+
+        :param wait: True to block until OBS reports the recording as paused through RecordStateChanged.
+        :param timeout: Seconds to wait when wait is True.
+        :return: With wait, a dictionary with output_active, output_state, output_path and the
+                 elapsed seconds until the state change. None otherwise.
+        """
+        if not wait:
+            self.client.pause_record()
+            return None
+        return self._states.run(self.client.pause_record, PAUSED, timeout)
+
+    async def pause_async(self, timeout: float = 10.0) -> dict:
+        """
+        Pauses the recording. Resolves when OBS reports the recording as paused, without polling.
+
+        :param timeout: Seconds to wait for the state change.
+        :return: A dictionary with output_active, output_state, output_path and the elapsed seconds until the state change.
         """
-        self.client.pause_record()
+        return await self._states.run_async(self.client.pause_record, PAUSED, timeout)
 
-    def resume(self):
+    def resume(self, wait: bool = False, timeout: float = 10.0) -> dict:
         """
         Resumes the recording after it has been paused.
+
+        :param wait: True to block until OBS reports the recording as resumed through RecordStateChanged.
+        :param timeout: Seconds to wait when wait is True.
+        :return: With wait, a dictionary with output_active, output_state, output_path and the
+                 elapsed seconds until the state change. None otherwise.
+        """
+        if not wait:
+            self.client.resume_record()
+            return None
+        return self._states.run(self.client.resume_record, RESUMED, timeout)
+
+    async def resume_async(self, timeout: float = 10.0) -> dict:
+        """
+        Resumes the recording after it has been paused. Resolves when OBS reports the recording as resumed, without polling.
+
+        :param timeout: Seconds to wait for the state change.
+        :return: A dictionary with output_active, output_state, output_path and the elapsed seconds until the state change.
         """
-        self.client.resume_record()
+        return await self._states.run_async(self.client.resume_record, RESUMED, timeout)
     
     def get_directory(self) -> str:
         """
@@ -0,0 +1,284 @@
+import obsws_python as obs
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from contextlib import contextmanager
+from .__utils import send_request_batch
+
+CONTROL = "control"
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+PRIORITIES = (CONTROL, INTERACTIVE, BACKGROUND)
+
+
+class RequestScheduler:
+    """
+    A scheduler that sits in front of the OBS WebSocket client and decides which pending
+    request goes on the wire next. Requests are queued per priority class (control,
+    interactive, background) and the highest class with a request ready always wins at
+    the next request boundary, so a scene cut never waits behind a queue of screenshots.
+
+    Each class can be rate limited with a token bucket, and a request that has waited
+    longer than max_wait is served ahead of higher classes so bulk traffic cannot starve.
+
+    Requests are dispatched with the client's send_async when it has one, so up to
+    max_in_flight requests are pipelined on the connection while the rest wait in the
+    priority queues.
+    """
+
+    def __init__(self, obs_controller: obs.ReqClient, rate_limits: dict = None, max_wait: float = 1.0, max_in_flight: int = 8):
+        """
+        Initializes the RequestScheduler and starts its worker thread.
+
+        :param obs_controller: An instance of the OBS WebSocket client that will send the requests.
+        :param rate_limits: Optional. A dictionary mapping a priority class to a (requests per second, burst) tuple.
+                            Classes that are not present are not rate limited.
+        :param max_wait: Seconds a queued request may wait before it is served regardless of its class.
+        :param max_in_flight: The maximum number of dispatched requests waiting for their response.
+        """
+        self.client = obs_controller
+        self.max_wait = max_wait
+        self.max_in_flight = max_in_flight
+        self.rate_limits = rate_limits or {}
+        for priority in self.rate_limits:
+            self._check_priority(priority)
+
+        self._queues = {priority: deque() for priority in PRIORITIES}
+        self._tokens = {priority: float(limit[1]) for priority, limit in self.rate_limits.items()}
+        self._refilled = time.monotonic()
+        self._condition = threading.Condition()
+        self._local = threading.local()
+        self._in_flight = 0
+        self._running = True
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def submit(self, priority: str, function, *args) -> Future:
+        """
+        Queues a call that uses the OBS connection and returns immediately. The callable runs
+        in a copy of the caller's context, so context variables such as the controller method
+        call recorded by a TrafficRecorder carry over to the scheduler thread.
+
+        :param priority: The priority class of the call.
+        :param function: The callable to run once the call is scheduled.
+        :param args: The arguments for the callable.
+        :return: A Future that resolves to the return value of the callable.
+        """
+        return self._enqueue(priority, function, args, False)
+
+    def send(self, priority: str, request_type: str, request_data: dict = None, raw: bool = False):
+        """
+        Sends a request through the scheduler and waits for its response.
+
+        :param priority: The priority class of the request.
+        :param request_type: The obs-websocket request type, e.g. 'SetCurrentProgramScene'.
+        :param request_data: Optional. The request data.
+        :param raw: True to return the raw response data instead of a dataclass.
+        :return: The response of the request.
+        """
+        if hasattr(self.client, "send_async"):
+            return self._enqueue(priority, self.client.send_async, (request_type, request_data, raw), True).result()
+        return self.submit(priority, self.client.send, request_type, request_data, raw).result()
+
+    def client_for(self, priority: str) -> "PrioritizedClient":
+        """
+        Returns an OBS WebSocket client whose requests go through this scheduler with the given priority.
+
+        :param priority: The priority class of the requests sent by the client.
+        :return: A client that can be passed to any controller.
+        """
+        self._check_priority(priority)
+        return PrioritizedClient(self, priority)
+
+    @contextmanager
+    def priority(self, priority: str):
+        """
+        Overrides the priority of every request sent from the current thread within the block.
+
+        :param priority: The priority class to use.
+        """
+        self._check_priority(priority)
+        previous = getattr(self._local, "priority", None)
+        self._local.priority = priority
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    def current_priority(self) -> str:
+        """
+        Returns the priority override of the current thread, or None if there is none.
+
+        :return: The priority class set with priority(), or None.
+        """
+        return getattr(self._local, "priority", None)
+
+    def pending(self) -> dict:
+        """
+        Returns the number of queued requests per priority class.
+
+        :return: A dictionary mapping every priority class to its queue length.
+        """
+        with self._condition:
+            return {priority: len(queue) for priority, queue in self._queues.items()}
+
+    def stop(self):
+        """
+        Stops the worker thread. Requests still queued are cancelled.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        self._worker.join()
+        for queue in self._queues.values():
+            for _, future, *_ in queue:
+                future.cancel()
+            queue.clear()
+
+    def _enqueue(self, priority: str, function, args: tuple, dispatch_async: bool) -> Future:
+        self._check_priority(priority)
+        future = Future()
+        with self._condition:
+            if not self._running:
+                raise RuntimeError("The request scheduler has been stopped")
+            self._queues[priority].append((time.monotonic(), future, function, args, contextvars.copy_context(), dispatch_async))
+            self._condition.notify()
+        return future
+
+    def _release(self):
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+
+    def _check_priority(self, priority: str):
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority class: {priority}")
+
+    def _refill(self, now: float):
+        elapsed = now - self._refilled
+        self._refilled = now
+        for priority, (rate, burst) in self.rate_limits.items():
+            self._tokens[priority] = min(float(burst), self._tokens[priority] + elapsed * rate)
+
+    def _ready(self, priority: str) -> bool:
+        return priority not in self._tokens or self._tokens[priority] >= 1.0
+
+    def _next(self, now: float):
+        starving = [priority for priority in PRIORITIES
+                    if self._queues[priority] and self._ready(priority)
+                    and now - self._queues[priority][0][0] >= self.max_wait]
+        if starving:
+            return min(starving, key=lambda priority: self._queues[priority][0][0])
+        for priority in PRIORITIES:
+            if self._queues[priority] and self._ready(priority):
+                return priority
+        return None
+
+    def _wait_time(self) -> float:
+        waits = [(1.0 - self._tokens[priority]) / self.rate_limits[priority][0]
+                 for priority in PRIORITIES if self._queues[priority] and priority in self._tokens]
+        return min(waits) if waits else None
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if not self._running:
+                        return
+                    if self._in_flight < self.max_in_flight:
+                        now = time.monotonic()
+                        self._refill(now)
+                        priority = self._next(now)
+                        if priority is not None:
+                            break
+                        self._condition.wait(self._wait_time())
+                    else:
+                        self._condition.wait()
+                if priority in self._tokens:
+                    self._tokens[priority] -= 1.0
+                _, future, function, args, context, dispatch_async = self._queues[priority].popleft()
+                self._in_flight += 1
+
+            if not future.set_running_or_notify_cancel():
+                self._release()
+                continue
+            try:
+                result = context.run(function, *args)
+            except BaseException as e:
+                future.set_exception(e)
+                self._release()
+                continue
+            if dispatch_async:
+                result.add_done_callback(lambda done, future=future: self._complete(future, done))
+            else:
+                future.set_result(result)
+                self._release()
+
+    def _complete(self, future: Future, done: Future):
+        self._release()
+        try:
+            future.set_result(done.result())
+        except BaseException as e:
+            future.set_exception(e)
+
+
+class PrioritizedClient(obs.ReqClient):
+    """
+    An OBS WebSocket client that sends every request through a RequestScheduler with a fixed
+    priority. It exposes the same methods as obs.ReqClient, so controllers can use it unchanged.
+    """
+
+    def __init__(self, scheduler: RequestScheduler, priority: str):
+        """
+        Initializes the PrioritizedClient. Use RequestScheduler.client_for() instead of creating it directly.
+
+        :param scheduler: The scheduler the requests go through.
+        :param priority: The priority class of the requests, unless overridden with RequestScheduler.priority().
+        """
+        self.scheduler = scheduler
+        self.priority = priority
+        self.base_client = scheduler.client.base_client
+
+    def with_priority(self, priority: str) -> "PrioritizedClient":
+        """
+        Returns a client for the same scheduler with a different priority.
+
+        :param priority: The priority class of the requests sent by the new client.
+        :return: A new PrioritizedClient.
+        """
+        return self.scheduler.client_for(priority)
+
+    def add_event_listener(self, callback, event_types: list = None, subs: int = 0):
+        """
+        Registers a callback for OBS events on the client behind the scheduler. Events are not scheduled.
+
+        :param callback: A callable that takes the event type and the event data.
+        :param event_types: Optional. The event types to receive. All events if not specified.
+        :param subs: Optional. Event subscription bits the callback needs.
+        """
+        self.scheduler.client.add_event_listener(callback, event_types, subs)
+
+    def remove_event_listener(self, callback):
+        """
+        Removes a callback registered with add_event_listener.
+
+        :param callback: The callback to remove.
+        """
+        self.scheduler.client.remove_event_listener(callback)
+
+    def send(self, param, data=None, raw=False):
+        return self.scheduler.send(self.scheduler.current_priority() or self.priority, param, data, raw)
+
+    def send_batch(self, requests: list, halt_on_failure: bool = False, execution_type: int = 0) -> list:
+        """
+        Sends several requests as one RequestBatch through the scheduler.
+
+        :param requests: A list of (request_type, request_data) tuples.
+        :param halt_on_failure: Whether OBS should stop processing the batch after the first failed request.
+        :param execution_type: 0 for serial realtime, 1 for serial frame, 2 for parallel.
+        :return: A list with the raw result of every executed request, in order.
+        """
+        priority = self.scheduler.current_priority() or self.priority
+        return self.scheduler.submit(priority, send_request_batch, self.scheduler.client, requests, halt_on_failure, execution_type).result()
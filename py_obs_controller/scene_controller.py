@@ -1,4 +1,5 @@
 import obsws_python as obs
+from .__utils import with_priority
 
 class SceneController:
     """
@@ -6,13 +7,14 @@ class SceneController:
     as well as to manage the current scene and its items.
     """
 
-    def __init__(self, obs_controller: obs.ReqClient):
+    def __init__(self, obs_controller: obs.ReqClient, priority: str = None):
         """
         Initializes the SceneController with a reference to the OBS WebSocket client.
         
         :param obs_controller: An instance of the OBS WebSocket client.
+        :param priority: Optional. The priority class of the requests when the client goes through a RequestScheduler.
         """
-        self.client = obs_controller
+        self.client = with_priority(obs_controller, priority)
     
     def get(self) -> list:
         """
@@ -22,14 +24,22 @@ class SceneController:
         """
         return self.client.get_scene_list().scenes
     
-    def get_group(self, group_name: str) -> list:
+    def get_groups(self) -> list:
         """
-        Returns a list of all scenes in the specified group.
+        Returns a list of all groups in the current OBS session.
         
-        :param group_name: The name of the group to get scenes for.
-        :return: A list of scene names.
+        :return: A list of group names.
         """
         return self.client.get_group_list().groups
+
+    def get_group(self, group_name: str) -> list:
+        """
+        Returns a list of all items in the specified group.
+        
+        :param group_name: The name of the group to get items for.
+        :return: A list of scene items.
+        """
+        return self.client.get_group_scene_item_list(group_name).scene_items
     
     def get_current(self) -> str:
         """
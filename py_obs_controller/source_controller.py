@@ -1,28 +1,119 @@
 import obsws_python as obs
 import base64
+import threading
+from collections import deque
+from obsws_python.error import OBSSDKRequestError
+from .__utils import decode_base64_into, decoded_base64_size, transform_matches, with_priority
+
+SOURCE_EVENTS = [
+    "SceneItemCreated", "SceneItemRemoved", "SceneRemoved", "SceneNameChanged",
+    "InputNameChanged", "CurrentSceneCollectionChanged",
+]
+MAX_PENDING_ECHOES = 64
+
 
 class SourceController:
     """
     A class for controlling sources in a given OBS scene.
+
+    Sources nested inside a group are addressed with a 'scene/group' path as the scene name,
+    e.g. set_enabled('Scene/Overlay', 'Logo'). When the client delivers OBS events, scene item
+    IDs, the items of every group and the transforms of the sources are cached and kept valid
+    from OBS events, so repeated calls on the same source need no lookup request at all.
     """
     
-    def __init__(self, obs_controller: obs.ReqClient):
+    def __init__(self, obs_controller: obs.ReqClient, priority: str = None):
         """
         Initializes the SourceController object with an OBS controller instance.
 
         :param obs_controller: An instance of the ObsController class.
+        :param priority: Optional. The priority class of the requests when the client goes through a RequestScheduler.
         """
-        self.client = obs_controller
+        self.client = with_priority(obs_controller, priority)
+        self._lock = threading.Lock()
+        self._item_ids = {}
+        self._groups = {}
+        self._transforms = {}
+        self._pending_echoes = {}
+        self._watching_transforms = False
+        self._local = threading.local()
+        self._caching = hasattr(self.client, "add_event_listener")
+        if self._caching:
+            self.client.add_event_listener(self._on_event, SOURCE_EVENTS)
     
     def get_id(self, scene_name: str, source_name: str) -> int:
         """
         Gets the scene item ID for the specified source in the specified scene.
 
-        :param scene_name: The name of the scene the source is in.
+        :param scene_name: The name of the scene the source is in, or a 'scene/group' path.
         :param source_name: The name of the source.
         :return: The scene item ID for the source.
         """
-        return self.client.get_scene_item_id(scene_name, source_name).scene_item_id
+        return self.resolve(scene_name, source_name)[1]
+
+    def resolve(self, scene_name: str, source_name: str) -> tuple:
+        """
+        Resolves a source to the scene or group that directly contains it and its scene item ID.
+        Takes at most one request, and none when the item is cached.
+
+        :param scene_name: The name of the scene the source is in, or a 'scene/group' path for a source inside a group.
+        :param source_name: The name of the source.
+        :return: A tuple with the name of the containing scene or group and the scene item ID.
+        """
+        container = scene_name.rsplit("/", 1)[-1]
+        if container != scene_name:
+            group = self._get_group_items(container)
+            if group is not None:
+                if source_name not in group:
+                    raise OBSSDKRequestError("GetSceneItemId", 600, f"No source was found by the name of `{source_name}` in group `{container}`")
+                return container, group[source_name]
+
+        with self._lock:
+            item_id = self._item_ids.get((scene_name, source_name))
+        if item_id is None:
+            item_id = self.client.get_scene_item_id(scene_name, source_name).scene_item_id
+            if self._caching:
+                with self._lock:
+                    self._item_ids[(scene_name, source_name)] = item_id
+        return scene_name, item_id
+
+    def get_group_items(self, group_name: str) -> dict:
+        """
+        Returns the sources inside a group, mapped to their scene item IDs.
+
+        :param group_name: The name of the group.
+        :return: A dictionary mapping source names to scene item IDs, or None if there is no such group.
+        """
+        group = self._get_group_items(group_name)
+        return dict(group) if group is not None else None
+
+    def _get_group_items(self, group_name: str) -> dict:
+        with self._lock:
+            if group_name in self._groups:
+                return self._groups[group_name]
+        try:
+            items = self.client.get_group_scene_item_list(group_name).scene_items
+            group = {}
+            for item in sorted(items, key=lambda item: item["sceneItemIndex"]):
+                group[item["sourceName"]] = item["sceneItemId"]
+        except OBSSDKRequestError:
+            group = None
+        if self._caching:
+            with self._lock:
+                self._groups[group_name] = group
+        return group
+
+    def _on_event(self, event_type: str, event_data: dict):
+        with self._lock:
+            if event_type in ("SceneItemCreated", "SceneItemRemoved", "SceneRemoved"):
+                scene_name = event_data["sceneName"]
+                self._groups.pop(scene_name, None)
+                self._item_ids = {key: item_id for key, item_id in self._item_ids.items() if key[0] != scene_name}
+                self._transforms = {key: transform for key, transform in self._transforms.items() if key[0] != scene_name}
+            else:
+                self._item_ids.clear()
+                self._groups.clear()
+                self._transforms.clear()
     
     def remove(self, scene_name: str, source_name: str):
         """
@@ -31,7 +122,7 @@ class SourceController:
         :param scene_name: The name of the scene the source is in.
         :param source_name: The name of the source to remove.
         """
-        item = self.get_id(scene_name, source_name)
+        scene_name, item = self.resolve(scene_name, source_name)
         self.client.remove_scene_item(scene_name, item)
     
     def get_index(self, scene_name: str, source_name: str):
@@ -42,7 +133,7 @@ class SourceController:
         :param source_name: The name of the source.
         :return: The index of the source in the scene.
         """
-        item = self.get_id(scene_name, source_name)
+        scene_name, item = self.resolve(scene_name, source_name)
         return self.client.get_scene_item_index(scene_name, item).scene_item_index
     
     def set_index(self, scene_name: str, source_name: str, index: int):
@@ -53,7 +144,7 @@ class SourceController:
         :param source_name: The name of the source.
         :param index: The new index for the source in the scene.
         """
-        item = self.get_id(scene_name, source_name)
+        scene_name, item = self.resolve(scene_name, source_name)
         self.client.set_scene_item_index(scene_name, item, index)
     
     def get_locked(self, scene_name: str, source_name: str):
@@ -64,7 +155,7 @@ class SourceController:
         :param source_name: The name of the source.
         :return: True if the source is locked in the scene, False otherwise.
         """
-        item = self.get_id(scene_name, source_name)
+        scene_name, item = self.resolve(scene_name, source_name)
         return self.client.get_scene_item_locked(scene_name, item).scene_item_locked
     
     def set_locked(self, scene_name: str, source_name: str, locked: bool):
@@ -75,7 +166,7 @@ class SourceController:
         :param source_name: The name of the source.
         :param locked: True to lock the source in the scene, False to unlock it.
         """
-        item = self.get_id(scene_name, source_name)
+        scene_name, item = self.resolve(scene_name, source_name)
         self.client.set_scene_item_locked(scene_name, item, locked)
     
     def get_enabled(self, scene_name: str, source_name: str) -> bool:
@@ -86,7 +177,7 @@ class SourceController:
         :param source_name: The name of the source to retrieve the enabled status for.
         :return: A boolean value indicating whether the source is currently enabled within the scene.
         """
-        item = self.get_id(scene_name, source_name)
+        scene_name, item = self.resolve(scene_name, source_name)
         return self.client.get_scene_item_enabled(scene_name, item).scene_item_enabled
     
     def set_enabled(self, scene_name: str, source_name: str, enabled: bool):
@@ -97,21 +188,26 @@ class SourceController:
         :param source_name: The name of the source to set the enabled status for.
         :param enabled: A boolean value indicating whether to enable or disable the source.
         """
-        item = self.get_id(scene_name, source_name)
+        scene_name, item = self.resolve(scene_name, source_name)
         self.client.set_scene_item_enabled(scene_name, item, enabled)
     
-    def get_transform(self, scene_name: str, source_name: str) -> dict:
+    def get_transform(self, scene_name: str, source_name: str, real_bounds: bool = False) -> dict:
         """
         Retrieves the current transformation properties for a source within a scene.
 
+        By default boundsWidth and boundsHeight are set to 1 so the result can be passed to
+        set_transform as it is. When the client delivers OBS events, the transform is served
+        from a cache kept up to date by SceneItemTransformChanged events.
+
         :param scene_name: The name of the scene that contains the source.
         :param source_name: The name of the source to retrieve the transformation properties for.
+        :param real_bounds: True to return the bounds as OBS reports them.
         :return: A dictionary containing the current transformation properties for the source.
         """
-        item = self.get_id(scene_name, source_name)
-        transform = self.client.get_scene_item_transform(scene_name, item).scene_item_transform
-        transform['boundsWidth'] = 1
-        transform['boundsHeight'] = 1
+        transform = dict(self._get_cached_transform(*self.resolve(scene_name, source_name)))
+        if not real_bounds:
+            transform['boundsWidth'] = 1
+            transform['boundsHeight'] = 1
         return transform
     
     def set_transform(self, scene_name: str, source_name: str, transform: dict):
@@ -122,8 +218,116 @@ class SourceController:
         :param source_name: The name of the source to set the transformation properties for.
         :param transform: A dictionary containing the new transformation properties for the source.
         """
-        item = self.get_id(scene_name, source_name)
-        self.client.set_scene_item_transform(scene_name, item, transform)
+        scene_name, item = self.resolve(scene_name, source_name)
+        self._send_transform(scene_name, item, transform)
+
+    def update_transform(self, scene_name: str, source_name: str, **fields):
+        """
+        Changes only some transformation properties of a source, e.g. update_transform('Scene', 'Logo', positionX=100).
+
+        Only the fields that differ from the cached transform are sent, and fields that are not
+        given (such as the bounds) are left untouched in OBS. Nothing is sent if nothing changed.
+
+        :param scene_name: The name of the scene that contains the source.
+        :param source_name: The name of the source to update.
+        :param fields: The transformation properties to change, with the names used by OBS (positionX, scaleY, rotation, ...).
+        """
+        scene_name, item = self.resolve(scene_name, source_name)
+        with self._lock:
+            current = self._transforms.get((scene_name, item), {})
+        changed = {key: value for key, value in fields.items() if current.get(key) != value}
+        if changed:
+            self._send_transform(scene_name, item, changed)
+
+    def move_by(self, scene_name: str, source_name: str, dx: float = 0.0, dy: float = 0.0):
+        """
+        Moves a source relative to its current position. Uses the cached transform, so it takes a
+        single request once the transform of the source is known.
+
+        :param scene_name: The name of the scene that contains the source.
+        :param source_name: The name of the source to move.
+        :param dx: The horizontal offset in pixels.
+        :param dy: The vertical offset in pixels.
+        """
+        scene_name, item = self.resolve(scene_name, source_name)
+        transform = self._get_cached_transform(scene_name, item)
+        self.update_transform(scene_name, source_name,
+                              positionX=transform["positionX"] + dx, positionY=transform["positionY"] + dy)
+
+    def scale_by(self, scene_name: str, source_name: str, factor_x: float, factor_y: float = None):
+        """
+        Scales a source relative to its current scale. Uses the cached transform, so it takes a
+        single request once the transform of the source is known.
+
+        :param scene_name: The name of the scene that contains the source.
+        :param source_name: The name of the source to scale.
+        :param factor_x: The horizontal scale factor.
+        :param factor_y: Optional. The vertical scale factor. Same as factor_x if not specified.
+        """
+        if factor_y is None:
+            factor_y = factor_x
+        scene_name, item = self.resolve(scene_name, source_name)
+        transform = self._get_cached_transform(scene_name, item)
+        self.update_transform(scene_name, source_name,
+                              scaleX=transform["scaleX"] * factor_x, scaleY=transform["scaleY"] * factor_y)
+
+    def _get_cached_transform(self, scene_name: str, item: int) -> dict:
+        with self._lock:
+            transform = self._transforms.get((scene_name, item))
+        if transform is None:
+            self._watch_transforms()
+            transform = self.client.get_scene_item_transform(scene_name, item).scene_item_transform
+            if self._caching:
+                with self._lock:
+                    self._transforms[(scene_name, item)] = transform
+        return transform
+
+    def _send_transform(self, scene_name: str, item: int, fields: dict):
+        # Every local change is echoed as a SceneItemTransformChanged event, which can arrive after
+        # later local changes when events have their own connection. The echoes still expected are
+        # kept in order, so _on_transform_changed can tell a stale echo from the latest state.
+        key = (scene_name, item)
+        if self._watching_transforms:
+            with self._lock:
+                self._pending_echoes.setdefault(key, deque(maxlen=MAX_PENDING_ECHOES)).append(fields)
+        try:
+            self.client.set_scene_item_transform(scene_name, item, fields)
+        except Exception:
+            with self._lock:
+                pending = self._pending_echoes.get(key, ())
+                for index, expected in enumerate(pending):
+                    if expected is fields:
+                        del pending[index]
+                        break
+            raise
+        self._update_cached_transform(scene_name, item, fields)
+
+    def _update_cached_transform(self, scene_name: str, item: int, fields: dict):
+        with self._lock:
+            transform = self._transforms.get((scene_name, item))
+            if transform is not None:
+                self._transforms[(scene_name, item)] = {**transform, **fields}
+
+    def _watch_transforms(self):
+        if self._caching and not self._watching_transforms:
+            self._watching_transforms = True
+            self.client.add_event_listener(self._on_transform_changed, ["SceneItemTransformChanged"],
+                                           obs.Subs.SCENEITEMTRANSFORMCHANGED)
+
+    def _on_transform_changed(self, event_type: str, event_data: dict):
+        key = (event_data["sceneName"], event_data["sceneItemId"])
+        transform = event_data["sceneItemTransform"]
+        with self._lock:
+            pending = self._pending_echoes.get(key)
+            if pending:
+                for index, expected in enumerate(pending):
+                    if transform_matches(transform, expected):
+                        for _ in range(index + 1):
+                            pending.popleft()
+                        if pending:
+                            return
+                        break
+            self._transforms[key] = transform
 
     def get_blend_mode(self, scene_name: str, source_name: str) -> str:
         """
@@ -133,7 +337,7 @@ class SourceController:
         :param source_name: The name of the source to retrieve the blend mode for.
         :return: A string representing the current blend mode of the source.
         """
-        item = self.get_id(scene_name, source_name)
+        scene_name, item = self.resolve(scene_name, source_name)
         return self.client.get_scene_item_blend_mode(scene_name, item).scene_item_blend_mode
     
     def set_blend_mode(self, scene_name: str, source_name: str, blend_mode: str):
@@ -144,7 +348,7 @@ class SourceController:
         :param source_name: The name of the source to set the blend mode for.
         :param blend_mode: A string representing the new blend mode for the source.
         """
-        item = self.get_id(scene_name, source_name)
+        scene_name, item = self.resolve(scene_name, source_name)
         self.client.set_scene_item_blend_mode(scene_name, item, blend_mode)
     
     def get_screenshot(self, name: str, img_format: str, width: int = None, height: int = None, quality: int = -1) -> bytes:
@@ -161,6 +365,78 @@ class SourceController:
         screenshot_data = self.client.get_source_screenshot(name, img_format, width, height, quality)
         return screenshot_data.image_data
 
+    def get_screenshot_bytes(self, name: str, img_format: str, width: int = None, height: int = None, quality: int = -1, out: bytearray = None) -> memoryview:
+        """
+        Retrieves a screenshot of a source as raw image bytes, decoded straight into a reusable buffer.
+
+        The data URI header is skipped in place and the base64 data is decoded in small chunks,
+        so continuous captures do not allocate full size copies on every call. Without an out
+        buffer, a buffer owned by the calling thread is reused, and the returned view is only
+        valid until the next call from the same thread. When a screenshot does not fit, a new
+        buffer of twice its size replaces it, so views still held by the caller are never resized.
+
+        :param name: Name of the source to take a screenshot of
+        :param img_format: Image compression format to use. Use GetVersion to get compatible image formats
+        :param width: Width to scale the screenshot to (>= 8, <= 4096). If not specified, full resolution will be used.
+        :param height: Height to scale the screenshot to (>= 8, <= 4096). If not specified, full resolution will be used.
+        :param quality: Compression quality to use. 0 for high compression, 100 for uncompressed. -1 to use "default"
+        :param out: Optional. A bytearray to decode into. It must be at least as large as the decoded image.
+        :return: A memoryview over the encoded image file (e.g. the PNG bytes).
+        """
+        image_data = self.get_screenshot(name, img_format, width, height, quality)
+        if out is None:
+            out = getattr(self._local, "screenshot_buffer", None)
+            size = decoded_base64_size(image_data)
+            if out is None or len(out) < size:
+                out = self._local.screenshot_buffer = bytearray(size * 2)
+        return decode_base64_into(image_data, out)
+
+    def get_screenshot_array(self, name: str, width: int = None, height: int = None, out=None):
+        """
+        Retrieves a screenshot of a source as a NumPy array of RGB or RGBA pixels. Requires NumPy.
+
+        The screenshot is requested as an uncompressed BMP, so its pixels are read directly from the
+        decoded buffer and copied once into the output array without an image decoding library.
+
+        :param name: Name of the source to take a screenshot of
+        :param width: Width to scale the screenshot to (>= 8, <= 4096). If not specified, full resolution will be used.
+        :param height: Height to scale the screenshot to (>= 8, <= 4096). If not specified, full resolution will be used.
+        :param out: Optional. A uint8 array of shape (height, width, channels) to write the pixels into.
+        :return: A uint8 array of shape (height, width, 3) or (height, width, 4).
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("get_screenshot_array requires numpy to be installed")
+
+        view = self.get_screenshot_bytes(name, "bmp", width, height)
+        offset = int.from_bytes(view[10:14], "little")
+        image_width = int.from_bytes(view[18:22], "little", signed=True)
+        image_height = int.from_bytes(view[22:26], "little", signed=True)
+        bits = int.from_bytes(view[28:30], "little")
+        compression = int.from_bytes(view[30:34], "little")
+        if bits not in (24, 32) or compression not in (0, 3):
+            raise ValueError(f"Unsupported BMP screenshot: {bits} bits per pixel, compression {compression}")
+
+        channels = bits // 8
+        rows = abs(image_height)
+        stride = (image_width * channels + 3) & ~3
+        pixels = np.frombuffer(view, dtype=np.uint8, count=stride * rows, offset=offset).reshape(rows, stride)
+        pixels = pixels[:, :image_width * channels].reshape(rows, image_width, channels)
+        if image_height > 0:
+            pixels = pixels[::-1]
+
+        if out is None:
+            out = np.empty((rows, image_width, channels), dtype=np.uint8)
+        elif out.shape != (rows, image_width, channels):
+            raise ValueError(f"The output array must have shape {(rows, image_width, channels)}, not {out.shape}")
+        np.copyto(out[..., 0], pixels[..., 2])
+        np.copyto(out[..., 1], pixels[..., 1])
+        np.copyto(out[..., 2], pixels[..., 0])
+        if channels == 4:
+            np.copyto(out[..., 3], pixels[..., 3])
+        return out
+
     def save_source_screenshot(self, source_name: str, image_format: str, image_file_path: str, image_width: int = None, image_height: int = None, image_compression_quality: int = -1) -> bool:
         """
         Saves a screenshot of a source to a file.
@@ -0,0 +1,220 @@
+import base64
+import hashlib
+import json
+import random
+import socketserver
+import struct
+import threading
+
+from .traffic_recorder import expand, read_capture
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+SUCCESS = {"result": True, "code": 100}
+
+
+def request_key(request_type: str, request_data: dict) -> tuple:
+    """
+    Returns the key a response is stored under: the request type and the request data as canonical JSON.
+    """
+    return request_type, json.dumps(request_data or {}, sort_keys=True)
+
+
+class StandInServer:
+    """
+    A local stand-in for the OBS WebSocket server, built on the standard library only. It
+    speaks obs-websocket v5 over JSON without authentication and answers every request with
+    the response recorded for the same request in a capture, or with the last response
+    recorded for the same request type, or with an empty success response.
+    """
+
+    def __init__(self, capture: str = None, host: str = "127.0.0.1", port: int = 0, response_delay: float = 0.0):
+        """
+        Initializes the StandInServer.
+
+        :param capture: Optional. The path of a capture written by a TrafficRecorder to take the responses from.
+        :param host: The address to listen on.
+        :param port: The port to listen on. A free port if 0, see the port attribute after start().
+        :param response_delay: Optional. The maximum random delay in seconds before every response. With a delay,
+                               responses on a connection are sent out of order, like OBS does for slow requests.
+        """
+        self.host = host
+        self.port = port
+        self.response_delay = response_delay
+        self.responses = {}
+        self.last_responses = {}
+        self.request_count = 0
+        self._server = None
+        self._lock = threading.Lock()
+        if capture is not None:
+            self.load(capture)
+
+    def load(self, capture: str):
+        """
+        Adds the responses of a capture.
+
+        :param capture: The path of a capture written by a TrafficRecorder.
+        """
+        for record in read_capture(capture):
+            if record["k"] == "req" and "s" in record:
+                self.add_response(record["q"], record.get("r"), record.get("rd"), record["s"])
+            elif record["k"] == "batch" and "r" in record:
+                for (request_type, request_data), result in zip(record["q"], record["r"]):
+                    self.add_response(request_type, result.get("r"), request_data, result["s"])
+
+    def add_response(self, request_type: str, response_data: dict = None, request_data: dict = None, status: dict = None):
+        """
+        Sets the response to a request.
+
+        :param request_type: The obs-websocket request type, e.g. 'GetSceneList'.
+        :param response_data: Optional. The response data.
+        :param request_data: Optional. The request data the response is for. Any request data if not specified.
+        :param status: Optional. The requestStatus of the response. Success if not specified.
+        """
+        response = (status or SUCCESS, response_data)
+        if request_data is not None:
+            self.responses[request_key(request_type, request_data)] = response
+        self.last_responses[request_type] = response
+
+    def respond(self, request_type: str, request_data: dict, request_id: str = None) -> dict:
+        """
+        Returns the response to a request.
+
+        :param request_type: The obs-websocket request type.
+        :param request_data: The request data.
+        :param request_id: Optional. The requestId of the request.
+        :return: The 'd' field of the RequestResponse message.
+        """
+        with self._lock:
+            self.request_count += 1
+        status, response_data = self.responses.get(
+            request_key(request_type, request_data), self.last_responses.get(request_type, (SUCCESS, None)))
+        response = {"requestType": request_type, "requestStatus": status}
+        if request_id is not None:
+            response["requestId"] = request_id
+        if response_data is not None:
+            response["responseData"] = expand(response_data)
+        return response
+
+    def start(self):
+        """
+        Starts listening and serving connections on a background thread.
+        """
+        stand_in = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                _Session(stand_in, self.request).run()
+
+        self._server = socketserver.ThreadingTCPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        """
+        Stops listening. Open connections are closed by their clients.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class _Session:
+    def __init__(self, server: StandInServer, sock):
+        self.server = server
+        self.sock = sock
+        self.reader = sock.makefile("rb")
+        self._send_lock = threading.Lock()
+
+    def run(self):
+        if not self._handshake():
+            return
+        self._send({"op": 0, "d": {"obsWebSocketVersion": "5.0.0", "rpcVersion": 1}})
+        while True:
+            message = self._receive()
+            if message is None:
+                return
+            message = json.loads(message)
+            op, data = message["op"], message["d"]
+            if op in (1, 3):
+                self._send({"op": 2, "d": {"negotiatedRpcVersion": 1}})
+            elif op == 6:
+                self._respond({"op": 7, "d": self.server.respond(data["requestType"], data.get("requestData"), data["requestId"])})
+            elif op == 8:
+                results = []
+                for request in data.get("requests", []):
+                    result = self.server.respond(request["requestType"], request.get("requestData"))
+                    results.append(result)
+                    if data.get("haltOnFailure") and not result["requestStatus"]["result"]:
+                        break
+                self._respond({"op": 9, "d": {"requestId": data["requestId"], "results": results}})
+
+    def _handshake(self) -> bool:
+        headers = {}
+        line = self.reader.readline()
+        while line not in (b"\r\n", b"\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+            line = self.reader.readline()
+        if "sec-websocket-key" not in headers:
+            return False
+        accept = base64.b64encode(hashlib.sha1((headers["sec-websocket-key"] + WEBSOCKET_GUID).encode()).digest()).decode()
+        response = ["HTTP/1.1 101 Switching Protocols", "Upgrade: websocket", "Connection: Upgrade", f"Sec-WebSocket-Accept: {accept}"]
+        protocols = [protocol.strip() for protocol in headers.get("sec-websocket-protocol", "").split(",")]
+        if "obswebsocket.json" in protocols:
+            response.append("Sec-WebSocket-Protocol: obswebsocket.json")
+        self.sock.sendall(("\r\n".join(response) + "\r\n\r\n").encode())
+        return True
+
+    def _receive(self):
+        fragments = []
+        while True:
+            header = self.reader.read(2)
+            if len(header) < 2:
+                return None
+            fin, opcode = header[0] & 0x80, header[0] & 0x0F
+            length = header[1] & 0x7F
+            if length == 126:
+                length = struct.unpack("!H", self.reader.read(2))[0]
+            elif length == 127:
+                length = struct.unpack("!Q", self.reader.read(8))[0]
+            mask = self.reader.read(4) if header[1] & 0x80 else None
+            payload = self.reader.read(length)
+            if mask is not None and length:
+                key = (mask * (length // 4 + 1))[:length]
+                payload = (int.from_bytes(payload, "big") ^ int.from_bytes(key, "big")).to_bytes(length, "big")
+            if opcode == 8:
+                self._write_frame(8, payload[:2])
+                return None
+            if opcode == 9:
+                self._write_frame(10, payload)
+                continue
+            if opcode == 10:
+                continue
+            fragments.append(payload)
+            if fin:
+                return b"".join(fragments).decode()
+
+    def _respond(self, message: dict):
+        if self.server.response_delay > 0:
+            threading.Timer(random.uniform(0, self.server.response_delay), self._send, [message]).start()
+        else:
+            self._send(message)
+
+    def _send(self, message: dict):
+        self._write_frame(1, json.dumps(message).encode())
+
+    def _write_frame(self, opcode: int, payload: bytes):
+        length = len(payload)
+        if length < 126:
+            header = struct.pack("!BB", 0x80 | opcode, length)
+        elif length < 1 << 16:
+            header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+        try:
+            with self._send_lock:
+                self.sock.sendall(header + payload)
+        except OSError:
+            pass
@@ -1,5 +1,6 @@
 import obsws_python as obs
-from .__utils import get_attributes_as_dict
+from .__utils import get_attributes_as_dict, with_priority
+from .output_state import OutputStateWaiter, STARTED, STOPPED
 
 class StreamController:
     """
@@ -7,13 +8,15 @@ class StreamController:
     get status and toggle on/off the stream.
     """
 
-    def __init__(self, obs_controller: obs.ReqClient):
+    def __init__(self, obs_controller: obs.ReqClient, priority: str = None):
         """
         Initializes the StreamController with a reference to the OBS WebSocket client.
         
         :param obs_controller: An instance of the OBS WebSocket client.
+        :param priority: Optional. The priority class of the requests when the client goes through a RequestScheduler.
         """
-        self.client = obs_controller
+        self.client = with_priority(obs_controller, priority)
+        self._states = OutputStateWaiter(self.client, "StreamStateChanged")
         
     def get_status(self) -> dict:
         """
@@ -29,14 +32,48 @@ class StreamController:
         """
         self.client.toggle_stream()
         
-    def start(self):
+    def start(self, wait: bool = False, timeout: float = 10.0) -> dict:
         """
         Starts the stream.
+
+        :param wait: True to block until OBS reports the stream as started through StreamStateChanged.
+        :param timeout: Seconds to wait when wait is True.
+        :return: With wait, a dictionary with output_active, output_state, output_path and the
+                 elapsed seconds until the state change. None otherwise.
+        """
+        if not wait:
+            self.client.start_stream()
+            return None
+        return self._states.run(self.client.start_stream, STARTED, timeout)
+
+    async def start_async(self, timeout: float = 10.0) -> dict:
+        """
+        Starts the stream. Resolves when OBS reports the stream as started, without polling.
+
+        :param timeout: Seconds to wait for the state change.
+        :return: A dictionary with output_active, output_state, output_path and the elapsed seconds until the state change.
         """
-        self.client.start_stream()
+        return await self._states.run_async(self.client.start_stream, STARTED, timeout)
 
-    def stop(self):
+    def stop(self, wait: bool = False, timeout: float = 10.0) -> dict:
         """
         Stops the stream.
+
+        :param wait: True to block until OBS reports the stream as stopped through StreamStateChanged.
+        :param timeout: Seconds to wait when wait is True.
+        :return: With wait, a dictionary with output_active, output_state, output_path and the
+                 elapsed seconds until the state change. None otherwise.
+        """
+        if not wait:
+            self.client.stop_stream()
+            return None
+        return self._states.run(self.client.stop_stream, STOPPED, timeout)
+
+    async def stop_async(self, timeout: float = 10.0) -> dict:
+        """
+        Stops the stream. Resolves when OBS reports the stream as stopped, without polling.
+
+        :param timeout: Seconds to wait for the state change.
+        :return: A dictionary with output_active, output_state, output_path and the elapsed seconds until the state change.
         """
-        self.client.stop_stream()
\ No newline at end of file
+        return await self._states.run_async(self.client.stop_stream, STOPPED, timeout)
\ No newline at end of file
@@ -0,0 +1,203 @@
+import obsws_python as obs
+import json
+import time
+from obsws_python.error import OBSSDKRequestError
+from .__utils import send_request_batch, with_priority
+from .source_controller import SourceController
+
+
+class TimelineController:
+    """
+    A controller for running timed cue lists against OBS. Cues are resolved to raw
+    requests ahead of time (scene item IDs included) so that firing a cue costs a
+    single send at its deadline. Deadlines are absolute offsets from the start of the
+    run on the monotonic clock, so round-trip latency never accumulates into drift.
+
+    A cue is a dictionary with the following keys:
+
+    - at: Offset in seconds from the start of the timeline.
+    - action: The controller method to call, e.g. 'scenes.set_current'.
+    - args: A list with the arguments for the controller method. Sources inside a group
+      are addressed with a 'scene/group' path as the scene name, as in SourceController.
+    """
+
+    def __init__(self, obs_controller: obs.ReqClient, frame_rate: float = 60.0, spin_time: float = 0.002, priority: str = None):
+        """
+        Initializes the TimelineController with a reference to the OBS WebSocket client.
+
+        :param obs_controller: An instance of the OBS WebSocket client.
+        :param frame_rate: Cues closer together than one frame at this rate are fired as a single batch.
+        :param spin_time: Seconds before each deadline to stop sleeping and busy-wait instead.
+        :param priority: Optional. The priority class of the requests when the client goes through a RequestScheduler.
+        """
+        self.client = with_priority(obs_controller, priority)
+        self.frame_rate = frame_rate
+        self.spin_time = spin_time
+        self.cues = []
+        self._prepared = None
+        self._sources = SourceController(self.client)
+
+        self._actions = {
+            "scenes.set_current": self._scene_request("SetCurrentProgramScene"),
+            "scenes.set_current_preview": self._scene_request("SetCurrentPreviewScene"),
+            "source.set_enabled": self._item_request("SetSceneItemEnabled", "sceneItemEnabled"),
+            "source.set_locked": self._item_request("SetSceneItemLocked", "sceneItemLocked"),
+            "source.set_index": self._item_request("SetSceneItemIndex", "sceneItemIndex"),
+            "source.set_transform": self._item_request("SetSceneItemTransform", "sceneItemTransform"),
+            "source.set_blend_mode": self._item_request("SetSceneItemBlendMode", "sceneItemBlendMode"),
+            "inputs.set_muted": self._input_request("SetInputMute", "inputMuted"),
+            "inputs.toggle_muted": self._input_request("ToggleInputMute"),
+            "inputs.set_volume": self._input_request("SetInputVolume", "inputVolumeMul"),
+            "inputs.set_volume_decibel": self._input_request("SetInputVolume", "inputVolumeDb"),
+            "inputs.set_audio_balance": self._input_request("SetInputAudioBalance", "inputAudioBalance"),
+            "inputs.set_settings": self._input_settings_request,
+            "filters.set_enabled": self._filter_request("SetSourceFilterEnabled", "filterEnabled"),
+            "filters.set_settings": self._filter_settings_request,
+            "record.start": self._plain_request("StartRecord"),
+            "record.stop": self._plain_request("StopRecord"),
+            "record.pause": self._plain_request("PauseRecord"),
+            "record.resume": self._plain_request("ResumeRecord"),
+            "stream.start": self._plain_request("StartStream"),
+            "stream.stop": self._plain_request("StopStream"),
+            "virtual_camera.start": self._plain_request("StartVirtualCam"),
+            "virtual_camera.stop": self._plain_request("StopVirtualCam"),
+        }
+
+    def load(self, cues: list):
+        """
+        Loads a cue list, replacing the current one. The cues are sorted by their offset.
+
+        :param cues: A list of cue dictionaries.
+        """
+        for cue in cues:
+            if cue["action"] not in self._actions:
+                raise ValueError(f"Unsupported timeline action: {cue['action']}")
+        self.cues = sorted(cues, key=lambda cue: cue["at"])
+        self._prepared = None
+
+    def load_file(self, file_path: str):
+        """
+        Loads a cue list from a JSON file containing a list of cue dictionaries.
+
+        :param file_path: Path to the JSON file.
+        """
+        with open(file_path, "r") as f:
+            self.load(json.load(f))
+
+    def prepare(self):
+        """
+        Resolves every cue into the raw request it will send. Scene item IDs are looked up
+        once per scene/source pair and input names are checked against OBS, so that
+        nothing has to be queried while the timeline is running.
+        """
+        self._item_ids = {}
+        self._input_names = {item["inputName"] for item in self.client.get_input_list().inputs}
+        self._prepared = []
+        for group in self._group_by_frame(self.cues):
+            requests = [self._actions[cue["action"]](*cue.get("args", [])) for cue in group]
+            self._prepared.append((group[0]["at"], group, requests))
+
+    def run(self, start_delay: float = 0.0) -> list:
+        """
+        Runs the loaded timeline, blocking until the last cue has been fired.
+
+        Cues that fall within the same frame are sent together as one request batch.
+
+        :param start_delay: Seconds to wait before the timeline offset 0.
+        :return: A list with a report dictionary for every cue containing the scheduled and
+                 actual firing offsets, the jitter between them, the request latency and the result.
+        """
+        if self._prepared is None:
+            self.prepare()
+
+        reports = []
+        start = time.monotonic() + start_delay
+        for offset, group, requests in self._prepared:
+            self._wait_until(start + offset)
+            fired = time.monotonic()
+            if len(requests) == 1:
+                results = [self._send_single(*requests[0])]
+            else:
+                results = send_request_batch(self.client, requests)
+            completed = time.monotonic()
+
+            for cue, result in zip(group, results):
+                status = result["requestStatus"]
+                reports.append({
+                    "at": cue["at"],
+                    "action": cue["action"],
+                    "scheduled": cue["at"],
+                    "fired": fired - start,
+                    "jitter": fired - (start + cue["at"]),
+                    "latency": completed - fired,
+                    "result": status["result"],
+                    "comment": status.get("comment"),
+                })
+        return reports
+
+    def _send_single(self, request_type: str, request_data: dict) -> dict:
+        try:
+            self.client.send(request_type, request_data, raw=True)
+        except OBSSDKRequestError as e:
+            return {"requestStatus": {"result": False, "code": e.code, "comment": str(e)}}
+        return {"requestStatus": {"result": True}}
+
+    def _wait_until(self, deadline: float):
+        remaining = deadline - time.monotonic()
+        if remaining > self.spin_time:
+            time.sleep(remaining - self.spin_time)
+        while time.monotonic() < deadline:
+            pass
+
+    def _group_by_frame(self, cues: list) -> list:
+        frame = 1.0 / self.frame_rate
+        groups = []
+        for cue in cues:
+            if groups and cue["at"] - groups[-1][0]["at"] < frame:
+                groups[-1].append(cue)
+            else:
+                groups.append([cue])
+        return groups
+
+    def _resolve_item(self, scene_name: str, source_name: str) -> tuple:
+        key = (scene_name, source_name)
+        if key not in self._item_ids:
+            self._item_ids[key] = self._sources.resolve(scene_name, source_name)
+        return self._item_ids[key]
+
+    def _check_input(self, input_name: str):
+        if input_name not in self._input_names:
+            raise ValueError(f"Unknown input in timeline: {input_name}")
+
+    def _plain_request(self, request_type: str):
+        return lambda: (request_type, None)
+
+    def _scene_request(self, request_type: str):
+        return lambda scene_name: (request_type, {"sceneName": scene_name})
+
+    def _item_request(self, request_type: str, field: str):
+        def build(scene_name, source_name, value):
+            container, item = self._resolve_item(scene_name, source_name)
+            return request_type, {"sceneName": container, "sceneItemId": item, field: value}
+        return build
+
+    def _input_request(self, request_type: str, field: str = None):
+        def build(input_name, *value):
+            self._check_input(input_name)
+            data = {"inputName": input_name}
+            if field is not None:
+                data[field] = value[0]
+            return request_type, data
+        return build
+
+    def _input_settings_request(self, input_name: str, input_settings: dict):
+        self._check_input(input_name)
+        return "SetInputSettings", {"inputName": input_name, "inputSettings": input_settings, "overlay": True}
+
+    def _filter_request(self, request_type: str, field: str):
+        def build(source_name, filter_name, value):
+            return request_type, {"sourceName": source_name, "filterName": filter_name, field: value}
+        return build
+
+    def _filter_settings_request(self, source_name: str, filter_name: str, filter_settings: dict, overlay: bool = True):
+        return "SetSourceFilterSettings", {"sourceName": source_name, "filterName": filter_name, "filterSettings": filter_settings, "overlay": overlay}
@@ -0,0 +1,185 @@
+import contextvars
+import functools
+import inspect
+import json
+import threading
+import time
+from concurrent.futures import Future
+from itertools import count
+
+CAPTURE_VERSION = 1
+MAX_STRING_LENGTH = 1024
+
+
+def compact(value):
+    """
+    Replaces strings longer than MAX_STRING_LENGTH, like screenshot image data, with a
+    placeholder that keeps their length and data URI header, so captures stay small.
+    """
+    if isinstance(value, str) and len(value) > MAX_STRING_LENGTH:
+        return {"$len": len(value), "$prefix": value[:value.find(",", 0, 64) + 1]}
+    if isinstance(value, dict):
+        return {key: compact(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [compact(item) for item in value]
+    return value
+
+
+def expand(value):
+    """
+    Restores the placeholders of compact() to strings of the original length.
+    """
+    if isinstance(value, dict):
+        if "$len" in value and "$prefix" in value:
+            return value["$prefix"] + "A" * (value["$len"] - len(value["$prefix"]))
+        return {key: expand(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [expand(item) for item in value]
+    return value
+
+
+def read_capture(path: str) -> list:
+    """
+    Reads the records of a capture written by a TrafficRecorder.
+
+    :param path: The path of the capture file.
+    :return: A list with every record of the capture, in the order they were written.
+    """
+    with open(path, encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+class TrafficRecorder:
+    """
+    Records the traffic of an ObsController to a compact append-only file with one JSON
+    record per line:
+
+    - call: a controller method call with its arguments, start offset and duration.
+    - req: a request with its data, response status, response data and timing.
+    - batch: a RequestBatch with its requests and results.
+
+    Requests and batches reference the controller method call that sent them, so a capture
+    can be replayed through the controller methods with TrafficReplayer. Strings longer than
+    MAX_STRING_LENGTH are stored as their length only.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initializes the TrafficRecorder and opens the capture file for appending.
+
+        :param path: The path of the capture file.
+        """
+        self.path = path
+        self.started = time.monotonic()
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._call = contextvars.ContextVar(f"traffic_recorder_call_{id(self)}", default=None)
+        self._call_ids = count(1)
+        self._write({"k": "start", "v": CAPTURE_VERSION, "wall": time.time()})
+
+    def instrument(self, controller, name: str):
+        """
+        Records the calls of the public methods of a controller. Calls made by a recorded
+        call, e.g. source.get_id inside source.set_enabled, are not recorded on their own.
+
+        :param controller: The controller instance, e.g. obs_controller.inputs.
+        :param name: The name of the controller in the ObsController, e.g. 'inputs'.
+        """
+        for attribute in dir(controller):
+            if attribute.startswith("_"):
+                continue
+            method = getattr(controller, attribute)
+            if inspect.ismethod(method) and not inspect.iscoroutinefunction(method):
+                setattr(controller, attribute, self._wrap(f"{name}.{attribute}", method))
+
+    def current_call(self) -> int:
+        """
+        Returns the id of the recorded controller method call running in the current context, if any.
+        A RequestScheduler runs requests in the context of the caller, so they keep their call.
+        """
+        return self._call.get()
+
+    def watch(self, op: int, data: dict, future: Future):
+        """
+        Records a request or a RequestBatch once its response arrives. Called by the Connection.
+
+        :param op: The opcode of the message, 6 for a request or 8 for a RequestBatch.
+        :param data: The 'd' field of the message.
+        :param future: The Future that resolves to the response.
+        """
+        started = time.monotonic()
+        parent = self.current_call()
+        future.add_done_callback(lambda done: self._on_response(op, data, started, parent, done))
+
+    def flush(self):
+        """
+        Writes the buffered records to the capture file.
+        """
+        with self._lock:
+            self._file.flush()
+
+    def close(self):
+        """
+        Flushes and closes the capture file. Later records are discarded.
+        """
+        with self._lock:
+            self._file.close()
+
+    def _wrap(self, name: str, method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            if self.current_call() is not None:
+                return method(*args, **kwargs)
+            call_id = next(self._call_ids)
+            token = self._call.set(call_id)
+            started = time.monotonic()
+            ok = False
+            try:
+                result = method(*args, **kwargs)
+                ok = True
+                return result
+            finally:
+                self._call.reset(token)
+                self._write_call({
+                    "k": "call", "i": call_id, "t": self._offset(started), "d": round(time.monotonic() - started, 6),
+                    "m": name, "a": compact(list(args)), "kw": compact(kwargs), "ok": ok,
+                })
+        return wrapper
+
+    def _on_response(self, op: int, data: dict, started: float, parent: int, future: Future):
+        record = {"t": self._offset(started), "d": round(time.monotonic() - started, 6)}
+        if parent is not None:
+            record["p"] = parent
+        if op == 6:
+            record.update({"k": "req", "q": data["requestType"], "rd": compact(data.get("requestData"))})
+        else:
+            record.update({
+                "k": "batch", "h": data["haltOnFailure"], "e": data["executionType"],
+                "q": [[request["requestType"], compact(request.get("requestData"))] for request in data["requests"]],
+            })
+        if future.exception() is not None:
+            record["x"] = str(future.exception())
+        elif op == 6:
+            response = future.result()
+            record["s"] = response["requestStatus"]
+            if "responseData" in response:
+                record["r"] = compact(response["responseData"])
+        else:
+            record["r"] = [{"q": result["requestType"], "s": result["requestStatus"], "r": compact(result.get("responseData"))}
+                           for result in future.result()["results"]]
+        self._write(record)
+
+    def _write_call(self, record: dict):
+        try:
+            self._write(record)
+        except (TypeError, ValueError):
+            self._write({**record, "a": None, "kw": None})
+
+    def _write(self, record: dict):
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line)
+
+    def _offset(self, moment: float) -> float:
+        return round(moment - self.started, 6)
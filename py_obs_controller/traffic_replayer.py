@@ -0,0 +1,105 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .__utils import latency_summary, send_request_batch
+from .stand_in_server import StandInServer
+from .traffic_recorder import expand, read_capture
+
+
+class TrafficReplayer:
+    """
+    Replays a capture written by a TrafficRecorder through the controller methods of an
+    ObsController, by default against a StandInServer that answers with the recorded
+    responses, and measures the throughput and latency of the replayed calls. Requests that
+    were not sent by a recorded controller method call are replayed as raw requests.
+    """
+
+    def __init__(self, capture: str):
+        """
+        Initializes the TrafficReplayer and loads the capture.
+
+        :param capture: The path of a capture written by a TrafficRecorder.
+        """
+        self.capture = capture
+        records = read_capture(capture)
+        calls = {record["i"] for record in records if record["k"] == "call" and record["a"] is not None}
+        self.items = sorted(
+            (record for record in records
+             if (record["k"] == "call" and record["i"] in calls)
+             or (record["k"] in ("req", "batch") and record.get("p") not in calls)),
+            key=lambda record: record["t"],
+        )
+
+    def run(self, obs_controller=None, speed: float = 1.0, workers: int = 8, **controller_options) -> dict:
+        """
+        Replays the capture.
+
+        :param obs_controller: Optional. The ObsController to replay through. If not specified, a StandInServer
+                               is started with the responses of the capture and an ObsController is connected to it.
+        :param speed: The replay speed: 1.0 for the recorded timing, 2.0 for twice as fast, None for as fast as possible.
+        :param workers: The number of threads that replay the calls concurrently.
+        :param controller_options: Optional. Keyword arguments for the ObsController connected to the StandInServer,
+                                   e.g. encoding='msgpack' or lanes=True.
+        :return: A dictionary with the number of replayed calls and errors, the duration in seconds, the throughput in
+                 calls per second, the latency distribution of all calls and the latency distribution of every method.
+        """
+        server = None
+        if obs_controller is None:
+            from .obs_controller import ObsController
+            server = StandInServer(self.capture)
+            server.start()
+            obs_controller = ObsController(server.host, server.port, "", **controller_options)
+
+        latencies = {}
+        errors = 0
+        try:
+            with ThreadPoolExecutor(workers) as executor:
+                started = time.monotonic()
+                futures = []
+                for record in self.items:
+                    if speed is not None:
+                        delay = started + record["t"] / speed - time.monotonic()
+                        if delay > 0:
+                            time.sleep(delay)
+                    futures.append(executor.submit(self._replay, obs_controller, record))
+                for future in futures:
+                    name, latency, ok = future.result()
+                    latencies.setdefault(name, []).append(latency)
+                    errors += not ok
+                duration = time.monotonic() - started
+        finally:
+            if server is not None:
+                obs_controller.client.disconnect()
+                server.stop()
+
+        samples = [latency for method_latencies in latencies.values() for latency in method_latencies]
+        return {
+            "calls": len(samples),
+            "errors": errors,
+            "duration": duration,
+            "throughput": len(samples) / duration if duration else 0.0,
+            "latency": latency_summary(samples),
+            "methods": {name: latency_summary(method_latencies) for name, method_latencies in sorted(latencies.items())},
+        }
+
+    def _replay(self, obs_controller, record: dict) -> tuple:
+        if record["k"] == "call":
+            controller_name, method_name = record["m"].split(".", 1)
+            method = getattr(getattr(obs_controller, controller_name), method_name)
+            call = lambda: method(*expand(record["a"]), **expand(record["kw"]))
+            name = record["m"]
+        elif record["k"] == "req":
+            call = lambda: obs_controller.client.send(record["q"], expand(record["rd"]), raw=True)
+            name = record["q"]
+        else:
+            requests = [(request_type, expand(request_data)) for request_type, request_data in record["q"]]
+            call = lambda: send_request_batch(obs_controller.client, requests, record["h"], record["e"])
+            name = "RequestBatch"
+
+        started = time.monotonic()
+        try:
+            call()
+            ok = True
+        except Exception:
+            ok = False
+        return name, time.monotonic() - started, ok
@@ -1,5 +1,6 @@
 import obsws_python as obs
-from .__utils import get_attributes_as_dict
+from .__utils import get_attributes_as_dict, with_priority
+from .output_state import OutputStateWaiter, STARTED, STOPPED
 
 class VirtualCameraController:
     """
@@ -7,13 +8,15 @@ class VirtualCameraController:
     get status and toggle on/off the virtual camera.
     """
 
-    def __init__(self, obs_controller: obs.ReqClient):
+    def __init__(self, obs_controller: obs.ReqClient, priority: str = None):
         """
         Initializes the VirtualCameraController with a reference to the OBS WebSocket client.
         
         :param obs_controller: An instance of the OBS WebSocket client.
+        :param priority: Optional. The priority class of the requests when the client goes through a RequestScheduler.
         """
-        self.client = obs_controller
+        self.client = with_priority(obs_controller, priority)
+        self._states = OutputStateWaiter(self.client, "VirtualcamStateChanged")
         
     def get_status(self) -> dict:
         """
@@ -29,14 +32,48 @@ class VirtualCameraController:
         """
         self.client.toggle_virtual_cam()
         
-    def start(self):
+    def start(self, wait: bool = False, timeout: float = 10.0) -> dict:
         """
         Starts the virtual camera.
+
+        :param wait: True to block until OBS reports the virtual camera as started through VirtualcamStateChanged.
+        :param timeout: Seconds to wait when wait is True.
+        :return: With wait, a dictionary with output_active, output_state, output_path and the
+                 elapsed seconds until the state change. None otherwise.
+        """
+        if not wait:
+            self.client.start_virtual_cam()
+            return None
+        return self._states.run(self.client.start_virtual_cam, STARTED, timeout)
+
+    async def start_async(self, timeout: float = 10.0) -> dict:
+        """
+        Starts the virtual camera. Resolves when OBS reports the virtual camera as started, without polling.
+
+        :param timeout: Seconds to wait for the state change.
+        :return: A dictionary with output_active, output_state, output_path and the elapsed seconds until the state change.
         """
-        self.client.start_virtual_cam()
+        return await self._states.run_async(self.client.start_virtual_cam, STARTED, timeout)
 
-    def stop(self):
+    def stop(self, wait: bool = False, timeout: float = 10.0) -> dict:
         """
         Stops the virtual camera.
+
+        :param wait: True to block until OBS reports the virtual camera as stopped through VirtualcamStateChanged.
+        :param timeout: Seconds to wait when wait is True.
+        :return: With wait, a dictionary with output_active, output_state, output_path and the
+                 elapsed seconds until the state change. None otherwise.
+        """
+        if not wait:
+            self.client.stop_virtual_cam()
+            return None
+        return self._states.run(self.client.stop_virtual_cam, STOPPED, timeout)
+
+    async def stop_async(self, timeout: float = 10.0) -> dict:
+        """
+        Stops the virtual camera. Resolves when OBS reports the virtual camera as stopped, without polling.
+
+        :param timeout: Seconds to wait for the state change.
+        :return: A dictionary with output_active, output_state, output_path and the elapsed seconds until the state change.
         """
-        self.client.stop_virtual_cam()
\ No newline at end of file
+        return await self._states.run_async(self.client.stop_virtual_cam, STOPPED, timeout)
\ No newline at end of file
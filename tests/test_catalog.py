@@ -0,0 +1,74 @@
+import threading
+
+from py_obs_controller.catalog_controller import CatalogController
+from py_obs_controller.obs_controller import ObsController
+from py_obs_controller.stand_in_server import StandInServer
+
+
+def test_concurrent_first_lookups_build_once():
+    server = StandInServer(response_delay=0.02)
+    server.add_response("GetInputList", {"inputs": [{"inputName": "Mic", "inputKind": "wasapi_input_capture", "inputUuid": "mic"}]})
+    server.add_response("GetSceneList", {"currentProgramSceneName": "Main", "scenes": [{"sceneName": "Main", "sceneUuid": "main", "sceneIndex": 0}]})
+    server.add_response("GetGroupList", {"groups": []})
+    server.add_response("GetSceneItemList", {"sceneItems": [{"sceneItemId": 1, "sourceName": "Mic", "sceneItemIndex": 0}]})
+    server.start()
+    obs_controller = ObsController(server.host, server.port, "")
+    results, errors = [], []
+
+    def lookup():
+        try:
+            results.append(obs_controller.catalog.get_input("Mic"))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=lookup) for _ in range(8)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        assert errors == []
+        assert [result["inputUuid"] for result in results] == ["mic"] * 8
+    finally:
+        obs_controller.client.disconnect()
+        server.stop()
+
+
+class CollectionSwitchingClient:
+    """
+    A client that reports a scene collection change while the first catalog build is in flight.
+    """
+
+    def __init__(self):
+        self.collection = "First"
+        self.listener = None
+
+    def add_event_listener(self, callback, event_types=None, subs=0):
+        self.listener = callback
+
+    def send_batch(self, requests, halt_on_failure=False, execution_type=0):
+        results = []
+        for request_type, _ in requests:
+            if request_type == "GetInputList":
+                data = {"inputs": [{"inputName": f"{self.collection} Mic", "inputKind": "wasapi_input_capture", "inputUuid": self.collection}]}
+            elif request_type == "GetSceneList":
+                data = {"scenes": []}
+            else:
+                data = {"groups": []}
+            results.append({"requestType": request_type, "requestStatus": {"result": True, "code": 100}, "responseData": data})
+        if self.collection == "First":
+            self.collection = "Second"
+            self.listener("CurrentSceneCollectionChanged", {"sceneCollectionName": "Second"})
+        return results
+
+
+def test_collection_change_during_build_rebuilds():
+    catalog = CatalogController(CollectionSwitchingClient())
+    assert catalog.get_input("First Mic") is None
+    assert catalog.get_input("Second Mic")["inputUuid"] == "Second"
+
+
+def test_lookups_return_copies():
+    catalog = CatalogController(CollectionSwitchingClient())
+    catalog.get_input("Second Mic")["inputName"] = "Changed"
+    assert catalog.get_input("Second Mic")["inputName"] == "Second Mic"
@@ -0,0 +1,64 @@
+import threading
+
+from py_obs_controller.__main__ import parse_command, run
+
+
+class FakeInputs:
+    """
+    Records the order in which commands start and finish. Commands on 'A' and 'B' wait for each other,
+    so they only finish when they are sent concurrently.
+    """
+
+    def __init__(self):
+        self.log = []
+        self.barrier = threading.Barrier(2, timeout=5)
+        self.lock = threading.Lock()
+
+    def set_muted(self, input_name, muted):
+        with self.lock:
+            self.log.append(("start", input_name))
+        if input_name in ("A", "B"):
+            self.barrier.wait()
+        with self.lock:
+            self.log.append(("end", input_name))
+        return muted
+
+    def get_list(self):
+        with self.lock:
+            self.log.append(("list", None))
+        return ["A", "B"]
+
+
+class FakeController:
+    def __init__(self):
+        self.inputs = FakeInputs()
+
+
+def test_parse_command():
+    assert parse_command('inputs.set_muted "Mic 1" true') == ("inputs.set_muted", ["Mic 1", True], {})
+    assert parse_command("inputs.set_volume Mic vol_db=-6") == ("inputs.set_volume", ["Mic"], {"vol_db": -6})
+    assert parse_command('{"method": "scenes.get", "args": []}') == ("scenes.get", [], {})
+
+
+def test_independent_commands_run_concurrently():
+    obs_controller = FakeController()
+    lines = ["inputs.set_muted A true", "inputs.set_muted B false", "inputs.get_list", "inputs.set_muted C true"]
+    results = list(run(obs_controller, lines))
+    assert results == [(1, True, None), (2, False, None), (3, ["A", "B"], None), (4, True, None)]
+    log = obs_controller.inputs.log
+    assert log.index(("list", None)) > max(log.index(("end", "A")), log.index(("end", "B")))
+    assert log.index(("start", "C")) > log.index(("list", None))
+
+
+def test_commands_on_the_same_name_run_in_order():
+    obs_controller = FakeController()
+    lines = ["inputs.set_muted C true", "inputs.set_muted C false", "inputs.set_muted D true"]
+    assert [result for _, result, _ in run(obs_controller, lines)] == [True, False, True]
+    log = obs_controller.inputs.log
+    assert log.index(("end", "C")) < log.index(("start", "C"), 1)
+
+
+def test_errors_are_reported_per_line():
+    obs_controller = FakeController()
+    results = list(run(obs_controller, ["inputs.unknown A", "# comment", "", "inputs._private", "inputs.set_muted C true"]))
+    assert [(number, type(error)) for number, _, error in results] == [(1, ValueError), (4, ValueError), (5, type(None))]
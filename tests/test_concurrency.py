@@ -0,0 +1,118 @@
+import random
+import threading
+
+import pytest
+
+from py_obs_controller.obs_controller import ObsController
+from py_obs_controller.stand_in_server import StandInServer
+
+SCENES = [f"Scene {index}" for index in range(4)]
+INPUTS = [f"Input {index}" for index in range(8)]
+THREADS = 16
+CALLS_PER_THREAD = 200
+
+
+def item_id(scene_name, input_name):
+    return SCENES.index(scene_name) * 100 + INPUTS.index(input_name) + 1
+
+
+def stand_in(response_delay):
+    server = StandInServer(response_delay=response_delay)
+    server.add_response("GetSceneList", {"currentProgramSceneName": SCENES[0], "currentPreviewSceneName": None,
+                                         "scenes": [{"sceneName": name, "sceneIndex": index} for index, name in enumerate(SCENES)]})
+    for index, input_name in enumerate(INPUTS):
+        server.add_response("GetInputMute", {"inputMuted": index % 2 == 0}, {"inputName": input_name})
+        server.add_response("GetInputVolume", {"inputVolumeMul": index / 10, "inputVolumeDb": 0.0}, {"inputName": input_name})
+    for scene_name in SCENES:
+        server.add_response("GetSceneItemList", {"sceneItems": [
+            {"sceneItemId": item_id(scene_name, input_name), "sourceName": f"{scene_name}/{input_name}"} for input_name in INPUTS
+        ]}, {"sceneName": scene_name})
+        for input_name in INPUTS:
+            scene_item_id = item_id(scene_name, input_name)
+            server.add_response("GetSceneItemId", {"sceneItemId": scene_item_id},
+                                {"sceneName": scene_name, "sourceName": input_name, "searchOffset": None})
+            server.add_response("GetSceneItemEnabled", {"sceneItemEnabled": scene_item_id % 3 == 0},
+                                {"sceneName": scene_name, "sceneItemId": scene_item_id})
+    server.start()
+    return server
+
+
+def call_and_expect(obs_controller, rng):
+    scene_name, input_name = rng.choice(SCENES), rng.choice(INPUTS)
+    choice = rng.randrange(5)
+    if choice == 0:
+        return obs_controller.inputs.get_muted(input_name), INPUTS.index(input_name) % 2 == 0
+    if choice == 1:
+        return obs_controller.inputs.get_volume(input_name), INPUTS.index(input_name) / 10
+    if choice == 2:
+        return obs_controller.source.get_enabled(scene_name, input_name), item_id(scene_name, input_name) % 3 == 0
+    if choice == 3:
+        items = obs_controller.scenes.get_items(scene_name)
+        return [item["sourceName"] for item in items], [f"{scene_name}/{name}" for name in INPUTS]
+    return obs_controller.scenes.get_current(), SCENES[0]
+
+
+@pytest.mark.parametrize("priority_scheduling", [False, True], ids=["direct", "scheduled"])
+@pytest.mark.parametrize("response_delay", [0.0, 0.005], ids=["in_order", "out_of_order"])
+def test_threads_share_one_controller(response_delay, priority_scheduling):
+    server = stand_in(response_delay)
+    obs_controller = ObsController(server.host, server.port, "", priority_scheduling=priority_scheduling)
+    errors, mismatches = [], []
+
+    def worker(seed):
+        rng = random.Random(seed)
+        for _ in range(CALLS_PER_THREAD):
+            try:
+                result, expected = call_and_expect(obs_controller, rng)
+            except Exception as e:
+                errors.append(e)
+                continue
+            if result != expected:
+                mismatches.append((result, expected))
+
+    threads = [threading.Thread(target=worker, args=(seed,), daemon=True) for seed in range(THREADS)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=60)
+        assert not any(thread.is_alive() for thread in threads)
+        assert errors == []
+        assert mismatches == []
+    finally:
+        obs_controller.client.disconnect()
+        server.stop()
+
+
+def test_scheduled_requests_are_pipelined():
+    server = StandInServer(response_delay=0.01)
+    server.add_response("GetInputMute", {"inputMuted": True})
+    server.start()
+    obs_controller = ObsController(server.host, server.port, "", priority_scheduling=True)
+    in_flight, peak, lock = [0], [0], threading.Lock()
+    send_async = obs_controller.scheduler.client.send_async
+
+    def counting_send_async(*args):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        future = send_async(*args)
+        future.add_done_callback(finished)
+        return future
+
+    def finished(_):
+        with lock:
+            in_flight[0] -= 1
+
+    obs_controller.scheduler.client.send_async = counting_send_async
+    threads = [threading.Thread(target=obs_controller.inputs.get_muted, args=("Mic",), daemon=True) for _ in range(THREADS)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        assert peak[0] > 1
+        assert peak[0] <= obs_controller.scheduler.max_in_flight
+    finally:
+        obs_controller.client.disconnect()
+        server.stop()
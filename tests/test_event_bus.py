@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+
+from py_obs_controller.event_bus import EventBus, Subs, COALESCE
+
+
+class ListenerClient:
+    """
+    A client that records the event listener registered by the bus, so tests can publish events directly.
+    """
+
+    def __init__(self):
+        self.listener = None
+        self.subs = None
+
+    def add_event_listener(self, callback, event_types=None, subs=0):
+        self.listener = callback
+        self.subs = subs
+
+    def remove_event_listener(self, callback):
+        self.listener = None
+        self.subs = None
+
+
+def volume(input_name, value):
+    return "InputVolumeChanged", {"inputName": input_name, "inputVolumeMul": value}
+
+
+def test_subscriptions_follow_the_subscribers():
+    client = ListenerClient()
+    bus = EventBus(client)
+    scenes = bus.subscribe(["CurrentProgramSceneChanged"])
+    meters = bus.subscribe(["InputVolumeMeters"])
+    assert client.subs == Subs.SCENES | Subs.INPUTVOLUMEMETERS
+    meters.close()
+    assert client.subs == Subs.SCENES
+    scenes.close()
+    assert client.listener is None
+
+
+def test_type_and_name_filters():
+    client = ListenerClient()
+    bus = EventBus(client)
+    subscription = bus.subscribe(["InputVolumeChanged"], names=["Mic"])
+    client.listener(*volume("Desktop", 0.5))
+    client.listener("InputMuteStateChanged", {"inputName": "Mic", "inputMuted": True})
+    client.listener(*volume("Mic", 0.25))
+    assert subscription.get(timeout=0) == volume("Mic", 0.25)
+    assert subscription.get(timeout=0) is None
+
+
+def test_drop_oldest_keeps_the_newest_events():
+    client = ListenerClient()
+    bus = EventBus(client)
+    subscription = bus.subscribe(["InputVolumeChanged"], maxsize=2)
+    for value in range(4):
+        client.listener(*volume("Mic", value))
+    assert [subscription.get(timeout=0)[1]["inputVolumeMul"] for _ in range(2)] == [2, 3]
+    assert subscription.metrics()["dropped"] == 2
+
+
+def test_coalesce_keeps_the_latest_event_per_key():
+    client = ListenerClient()
+    bus = EventBus(client)
+    subscription = bus.subscribe(["InputVolumeChanged"], maxsize=8, policy=COALESCE)
+    for value in range(3):
+        client.listener(*volume("Mic", value))
+        client.listener(*volume("Desktop", value))
+    assert [subscription.get(timeout=0) for _ in range(2)] == [volume("Mic", 2), volume("Desktop", 2)]
+    assert subscription.metrics()["coalesced"] == 4
+
+
+def test_callback_runs_on_its_own_thread():
+    client = ListenerClient()
+    bus = EventBus(client)
+    received, delivered = [], threading.Event()
+
+    def callback(event_type, event_data):
+        received.append((event_type, event_data, threading.current_thread()))
+        delivered.set()
+
+    subscription = bus.subscribe(["InputVolumeChanged"], callback=callback)
+    client.listener(*volume("Mic", 1.0))
+    assert delivered.wait(5)
+    subscription.close()
+    assert received[0][:2] == volume("Mic", 1.0)
+    assert received[0][2] is not threading.current_thread()
+
+
+def test_unknown_policy_raises():
+    with pytest.raises(ValueError):
+        EventBus(ListenerClient()).subscribe(policy="unknown")
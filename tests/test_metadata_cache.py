@@ -0,0 +1,37 @@
+import pytest
+
+from py_obs_controller.obs_controller import ObsController
+from py_obs_controller.stand_in_server import StandInServer
+
+
+@pytest.fixture
+def stand_in():
+    server = StandInServer()
+    server.add_response("GetInputDefaultSettings", {"defaultInputSettings": {"font": {"face": "Arial", "size": 48}}})
+    server.add_response("GetSourceFilterDefaultSettings", {"defaultFilterSettings": {"color": {"r": 1, "g": 2}}})
+    server.start()
+    obs_controller = ObsController(server.host, server.port, "")
+    yield server, obs_controller
+    obs_controller.client.disconnect()
+    server.stop()
+
+
+def test_keyword_and_positional_calls_share_an_entry(stand_in):
+    server, obs_controller = stand_in
+    before = server.request_count
+    assert obs_controller.inputs.get_default_settings(input_kind="text_gdiplus")["font"]["size"] == 48
+    assert obs_controller.inputs.get_default_settings("text_gdiplus")["font"]["size"] == 48
+    assert obs_controller.filters.get_default_settings(filter_kind="color_filter")["color"]["g"] == 2
+    assert server.request_count - before == 2
+
+
+def test_nested_changes_do_not_reach_the_cache(stand_in):
+    _, obs_controller = stand_in
+    obs_controller.inputs.get_default_settings("text_gdiplus")["font"]["size"] = 12
+    assert obs_controller.inputs.get_default_settings("text_gdiplus")["font"]["size"] == 48
+
+
+def test_unknown_keyword_raises(stand_in):
+    _, obs_controller = stand_in
+    with pytest.raises(TypeError):
+        obs_controller.inputs.get_default_settings(kind="text_gdiplus")
@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+from obsws_python.error import OBSSDKTimeoutError
+
+from py_obs_controller.output_state import OutputStateError, OutputStateWaiter, STARTED, STOPPED
+
+
+class EventClient:
+    def __init__(self):
+        self.listener = None
+
+    def add_event_listener(self, callback, event_types=None, subs=0):
+        self.listener = callback
+
+
+def reporting(client, state, active):
+    return lambda: client.listener("RecordStateChanged", {"outputActive": active, "outputState": state,
+                                                          "outputPath": "/tmp/recording.mkv"})
+
+
+def test_wait_for_the_state():
+    client = EventClient()
+    waiter = OutputStateWaiter(client, "RecordStateChanged")
+    result = waiter.run(reporting(client, STARTED, True), STARTED, timeout=1)
+    assert (result["output_active"], result["output_state"], result["output_path"]) == (True, STARTED, "/tmp/recording.mkv")
+
+
+def test_opposite_state_fails_the_wait():
+    client = EventClient()
+    waiter = OutputStateWaiter(client, "RecordStateChanged")
+    with pytest.raises(OutputStateError):
+        waiter.run(reporting(client, STOPPED, False), STARTED, timeout=1)
+
+
+def test_wait_times_out():
+    waiter = OutputStateWaiter(EventClient(), "RecordStateChanged")
+    with pytest.raises(OBSSDKTimeoutError):
+        waiter.run(lambda: None, STARTED, timeout=0.05)
+
+
+def test_wait_without_blocking_the_event_loop():
+    client = EventClient()
+    waiter = OutputStateWaiter(client, "RecordStateChanged")
+    result = asyncio.run(waiter.run_async(reporting(client, STOPPED, False), STOPPED, timeout=1))
+    assert result["output_state"] == STOPPED
+
+
+def test_waiting_requires_events():
+    waiter = OutputStateWaiter(object(), "RecordStateChanged")
+    with pytest.raises(ValueError):
+        waiter.run(lambda: None, STARTED)
@@ -0,0 +1,139 @@
+import threading
+import time
+from concurrent.futures import CancelledError, Future
+
+import pytest
+
+from py_obs_controller.request_scheduler import RequestScheduler, BACKGROUND, CONTROL, INTERACTIVE
+
+
+class HeldClient:
+    """
+    A client whose requests stay in flight until the test resolves them.
+    """
+
+    def __init__(self):
+        self.sent = []
+        self.condition = threading.Condition()
+
+    def send_async(self, param, data=None, raw=False) -> Future:
+        future = Future()
+        with self.condition:
+            self.sent.append((param, future))
+            self.condition.notify_all()
+        return future
+
+    def wait_for_sent(self, count: int):
+        with self.condition:
+            assert self.condition.wait_for(lambda: len(self.sent) >= count, 5)
+
+    def respond(self, index: int):
+        self.sent[index][1].set_result(self.sent[index][0])
+
+
+def send_in_background(scheduler, priority, request_type):
+    def send():
+        try:
+            scheduler.send(priority, request_type)
+        except CancelledError:
+            pass
+
+    thread = threading.Thread(target=send, daemon=True)
+    thread.start()
+    return thread
+
+
+def wait_for_queued(scheduler, count: int):
+    deadline = time.monotonic() + 5
+    while sum(scheduler.pending().values()) < count:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_highest_priority_is_dispatched_first():
+    client = HeldClient()
+    scheduler = RequestScheduler(client, max_in_flight=1)
+    try:
+        send_in_background(scheduler, BACKGROUND, "Busy")
+        client.wait_for_sent(1)
+        for priority in (BACKGROUND, INTERACTIVE, CONTROL):
+            send_in_background(scheduler, priority, priority)
+        wait_for_queued(scheduler, 3)
+        for index in range(3):
+            client.respond(index)
+            client.wait_for_sent(index + 2)
+        assert [request_type for request_type, _ in client.sent] == ["Busy", CONTROL, INTERACTIVE, BACKGROUND]
+    finally:
+        for _, future in client.sent:
+            if not future.done():
+                future.set_result(None)
+        scheduler.stop()
+
+
+def test_requests_waiting_longer_than_max_wait_go_first():
+    client = HeldClient()
+    scheduler = RequestScheduler(client, max_wait=0.05, max_in_flight=1)
+    try:
+        send_in_background(scheduler, BACKGROUND, "Busy")
+        client.wait_for_sent(1)
+        send_in_background(scheduler, BACKGROUND, BACKGROUND)
+        wait_for_queued(scheduler, 1)
+        time.sleep(0.1)
+        send_in_background(scheduler, CONTROL, CONTROL)
+        wait_for_queued(scheduler, 2)
+        client.respond(0)
+        client.wait_for_sent(2)
+        assert client.sent[1][0] == BACKGROUND
+    finally:
+        for _, future in client.sent:
+            if not future.done():
+                future.set_result(None)
+        scheduler.stop()
+
+
+def test_requests_are_pipelined_up_to_max_in_flight():
+    client = HeldClient()
+    scheduler = RequestScheduler(client, max_in_flight=2)
+    try:
+        for index in range(3):
+            send_in_background(scheduler, INTERACTIVE, f"Request {index}")
+        client.wait_for_sent(2)
+        wait_for_queued(scheduler, 1)
+        assert len(client.sent) == 2
+        client.respond(1)
+        client.wait_for_sent(3)
+    finally:
+        for _, future in client.sent:
+            if not future.done():
+                future.set_result(None)
+        scheduler.stop()
+
+
+def test_rate_limit():
+    scheduler = RequestScheduler(object(), rate_limits={BACKGROUND: (50, 1)})
+    try:
+        started = time.monotonic()
+        futures = [scheduler.submit(BACKGROUND, time.monotonic) for _ in range(4)]
+        sent = [future.result(timeout=5) for future in futures]
+        assert sent[-1] - started >= 0.05
+    finally:
+        scheduler.stop()
+
+
+def test_errors_reach_the_caller():
+    scheduler = RequestScheduler(object())
+    try:
+        with pytest.raises(ZeroDivisionError):
+            scheduler.submit(CONTROL, lambda: 1 / 0).result(timeout=5)
+    finally:
+        scheduler.stop()
+
+
+def test_stop_cancels_queued_requests():
+    scheduler = RequestScheduler(object(), rate_limits={BACKGROUND: (0.001, 0)})
+    future = scheduler.submit(BACKGROUND, lambda: "sent")
+    assert scheduler.pending()[BACKGROUND] == 1
+    scheduler.stop()
+    assert future.cancelled()
+    with pytest.raises(CancelledError):
+        future.result(timeout=1)
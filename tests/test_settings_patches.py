@@ -0,0 +1,55 @@
+import pytest
+
+from py_obs_controller.obs_controller import ObsController
+from py_obs_controller.stand_in_server import StandInServer
+
+
+@pytest.fixture
+def stand_in():
+    server = StandInServer()
+    server.add_response("GetInputSettings", {"inputKind": "text_gdiplus", "inputSettings": {"text": "Hello", "opacity": 100}})
+    server.add_response("GetInputDefaultSettings", {"defaultInputSettings": {"text": "", "opacity": 100, "color": 0}})
+    server.add_response("SetInputSettings")
+    server.add_response("GetSourceFilter", {"filterEnabled": True, "filterIndex": 0, "filterKind": "color_filter_v2",
+                                            "filterSettings": {"opacity": 1.0}})
+    server.add_response("GetSourceFilterDefaultSettings", {"defaultFilterSettings": {"opacity": 1.0, "gamma": 0.0}})
+    server.add_response("SetSourceFilterSettings")
+    server.start()
+    obs_controller = ObsController(server.host, server.port, "")
+    yield server, obs_controller
+    obs_controller.client.disconnect()
+    server.stop()
+
+
+def test_input_patch_sends_only_changes(stand_in):
+    server, obs_controller = stand_in
+    assert obs_controller.inputs.patch_settings("Title", {"text": "Hello", "opacity": 50}) == {"opacity": 50}
+    before = server.request_count
+    assert obs_controller.inputs.patch_settings("Title", {"text": "Hello", "opacity": 50}) == {}
+    assert obs_controller.inputs.patch_settings("Title", {"text": "Bye"}) == {"text": "Bye"}
+    assert server.request_count - before == 1
+
+
+def test_input_patch_follows_settings_events(stand_in):
+    _, obs_controller = stand_in
+    obs_controller.inputs.patch_settings("Title", {"text": "Hello"})
+    obs_controller.inputs._on_event("InputSettingsChanged", {"inputName": "Title", "inputSettings": {"text": "Changed", "opacity": 100}})
+    assert obs_controller.inputs.patch_settings("Title", {"text": "Hello"}) == {"text": "Hello"}
+
+
+def test_input_patch_validates_keys(stand_in):
+    _, obs_controller = stand_in
+    assert obs_controller.inputs.patch_settings("Title", {"color": 255}, validate=True) == {"color": 255}
+    with pytest.raises(ValueError):
+        obs_controller.inputs.patch_settings("Title", {"colour": 255}, validate=True)
+
+
+def test_filter_patch_sends_only_changes(stand_in):
+    server, obs_controller = stand_in
+    assert obs_controller.filters.patch_settings("Camera", "Color", {"opacity": 0.5, "gamma": 0.0}, validate=True) \
+        == {"opacity": 0.5, "gamma": 0.0}
+    before = server.request_count
+    assert obs_controller.filters.patch_settings("Camera", "Color", {"opacity": 0.5}) == {}
+    assert server.request_count == before
+    with pytest.raises(ValueError):
+        obs_controller.filters.patch_settings("Camera", "Color", {"brightness": 1.0}, validate=True)
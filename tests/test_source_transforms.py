@@ -0,0 +1,52 @@
+import pytest
+
+from py_obs_controller.obs_controller import ObsController
+from py_obs_controller.stand_in_server import StandInServer
+
+TRANSFORM = {"positionX": 0.0, "positionY": 0.0, "scaleX": 1.0, "scaleY": 1.0, "rotation": 0.0,
+             "boundsWidth": 0.0, "boundsHeight": 0.0}
+
+
+@pytest.fixture
+def source():
+    server = StandInServer()
+    server.add_response("GetSceneItemId", {"sceneItemId": 7})
+    server.add_response("GetSceneItemTransform", {"sceneItemTransform": TRANSFORM})
+    server.add_response("SetSceneItemTransform")
+    server.start()
+    obs_controller = ObsController(server.host, server.port, "")
+    obs_controller.source.get_transform("Scene", "Logo")
+    yield obs_controller.source
+    obs_controller.client.disconnect()
+    server.stop()
+
+
+def echo(source, position_x):
+    source._on_transform_changed("SceneItemTransformChanged", {
+        "sceneName": "Scene", "sceneItemId": 7, "sceneItemTransform": {**TRANSFORM, "positionX": position_x},
+    })
+
+
+def position_x(source):
+    return source.get_transform("Scene", "Logo")["positionX"]
+
+
+def test_late_echoes_do_not_undo_local_moves(source):
+    source.move_by("Scene", "Logo", dx=10)
+    source.move_by("Scene", "Logo", dx=10)
+    echo(source, 10.0)
+    assert position_x(source) == 20
+    source.move_by("Scene", "Logo", dx=10)
+    assert position_x(source) == 30
+    echo(source, 20.0)
+    echo(source, 30.0)
+    assert position_x(source) == 30
+
+
+def test_changes_made_elsewhere_are_applied(source):
+    source.move_by("Scene", "Logo", dx=10)
+    echo(source, 10.0)
+    echo(source, 500.0)
+    assert position_x(source) == 500
+    source.move_by("Scene", "Logo", dx=10)
+    assert position_x(source) == 510
@@ -0,0 +1,51 @@
+import pytest
+
+from py_obs_controller.obs_controller import ObsController
+from py_obs_controller.stand_in_server import StandInServer
+
+CUES = [
+    {"at": 0.05, "action": "inputs.set_muted", "args": ["Mic", True]},
+    {"at": 0.0, "action": "scenes.set_current", "args": ["Intro"]},
+    {"at": 0.001, "action": "source.set_enabled", "args": ["Intro", "Logo", False]},
+]
+
+
+@pytest.fixture
+def stand_in():
+    server = StandInServer()
+    server.add_response("GetInputList", {"inputs": [{"inputName": "Mic", "inputKind": "wasapi_input_capture"}]})
+    server.add_response("GetSceneItemId", {"sceneItemId": 3})
+    server.add_response("SetCurrentProgramScene")
+    server.add_response("SetSceneItemEnabled")
+    server.add_response("SetInputMute")
+    server.start()
+    obs_controller = ObsController(server.host, server.port, "")
+    yield server, obs_controller
+    obs_controller.client.disconnect()
+    server.stop()
+
+
+def test_cues_fire_in_order_at_their_offsets(stand_in):
+    server, obs_controller = stand_in
+    obs_controller.timeline.load(CUES)
+    obs_controller.timeline.prepare()
+    before = server.request_count
+    reports = obs_controller.timeline.run()
+    assert [report["action"] for report in reports] == ["scenes.set_current", "source.set_enabled", "inputs.set_muted"]
+    assert all(report["result"] for report in reports)
+    assert reports[0]["fired"] == reports[1]["fired"]
+    assert all(-1 / obs_controller.timeline.frame_rate < report["jitter"] < 0.05 for report in reports)
+    assert server.request_count - before == 3
+
+
+def test_unsupported_action_is_rejected(stand_in):
+    _, obs_controller = stand_in
+    with pytest.raises(ValueError):
+        obs_controller.timeline.load([{"at": 0, "action": "inputs.remove", "args": ["Mic"]}])
+
+
+def test_unknown_input_is_rejected_when_preparing(stand_in):
+    _, obs_controller = stand_in
+    obs_controller.timeline.load([{"at": 0, "action": "inputs.set_muted", "args": ["Desktop", True]}])
+    with pytest.raises(ValueError):
+        obs_controller.timeline.prepare()
@@ -0,0 +1,48 @@
+import pytest
+
+from py_obs_controller.obs_controller import ObsController
+from py_obs_controller.stand_in_server import StandInServer
+from py_obs_controller.traffic_recorder import read_capture
+from py_obs_controller.traffic_replayer import TrafficReplayer
+
+INPUTS = ["Mic", "Desktop"]
+
+
+def record(path, priority_scheduling):
+    server = StandInServer()
+    for index, input_name in enumerate(INPUTS):
+        server.add_response("GetInputMute", {"inputMuted": index == 0}, {"inputName": input_name})
+    server.add_response("SetInputMute")
+    server.start()
+    obs_controller = ObsController(server.host, server.port, "", priority_scheduling=priority_scheduling,
+                                   record_traffic=str(path))
+    try:
+        for input_name in INPUTS:
+            obs_controller.inputs.get_muted(input_name)
+            obs_controller.inputs.set_muted(input_name, True)
+        obs_controller.client.send("GetInputMute", {"inputName": "Mic"}, raw=True)
+    finally:
+        obs_controller.client.disconnect()
+        obs_controller.recorder.close()
+        server.stop()
+
+
+@pytest.mark.parametrize("priority_scheduling", [False, True], ids=["direct", "scheduled"])
+def test_requests_reference_their_call(tmp_path, priority_scheduling):
+    path = tmp_path / "capture.jsonl"
+    record(path, priority_scheduling)
+    records = read_capture(str(path))
+    calls = {record["i"]: record for record in records if record["k"] == "call"}
+    requests = [record for record in records if record["k"] == "req"]
+    assert [call["m"] for call in calls.values()] == ["inputs.get_muted", "inputs.set_muted"] * 2
+    assert [calls[request["p"]]["a"][0] for request in requests if "p" in request] == ["Mic", "Mic", "Desktop", "Desktop"]
+    assert [request for request in requests if "p" not in request][0]["rd"] == {"inputName": "Mic"}
+
+
+def test_replay_against_the_stand_in(tmp_path):
+    path = tmp_path / "capture.jsonl"
+    record(path, False)
+    result = TrafficReplayer(str(path)).run(speed=None)
+    assert result["calls"] == 5
+    assert result["errors"] == 0
+    assert set(result["methods"]) == {"inputs.get_muted", "inputs.set_muted", "GetInputMute"}